@@ -19,6 +19,7 @@ Usage:
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
 from datetime import datetime, timedelta
@@ -41,6 +42,14 @@ DONE_DIR = VAULT_DIR / "Done"
 # Audit log for sent email counts
 AUDIT_LOG = _PROJECT_ROOT / "logs" / "audit.log"
 
+# Canned result returned when HACKATHON_COLLECTOR_FAKE is set (tests)
+_FAKE_DATA = {
+    "emails_received": 0,
+    "emails_sent": 0,
+    "key_threads": [],
+    "avg_response_hours": None,
+}
+
 
 def _count_gmail_vault_files(since: datetime) -> list[dict]:
     """Find gmail_*.md files across all vault stages, modified since cutoff."""
@@ -155,6 +164,9 @@ def collect(weeks_back: int = 1) -> dict:
         emails_received, emails_sent, key_threads,
         avg_response_hours
     """
+    if os.environ.get("HACKATHON_COLLECTOR_FAKE"):
+        return dict(_FAKE_DATA)
+
     cutoff = datetime.now() - timedelta(weeks=weeks_back)
 
     # Received emails (Gmail imports to vault)
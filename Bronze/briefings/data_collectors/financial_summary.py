@@ -17,6 +17,7 @@ Usage:
 
 from __future__ import annotations
 
+import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -27,6 +28,21 @@ if str(_PROJECT_ROOT) not in sys.path:
 
 from core.error_logger import logger as error_logger
 
+# Canned result returned when HACKATHON_COLLECTOR_FAKE is set (tests)
+_FAKE_DATA = {
+    "available": False,
+    "revenue_this_week": None,
+    "revenue_last_week": None,
+    "revenue_change_pct": None,
+    "expenses_this_week": None,
+    "expenses_last_week": None,
+    "expenses_change_pct": None,
+    "ar_total": None,
+    "ar_aging": None,
+    "cash_position": None,
+    "cash_accounts": [],
+}
+
 
 def _week_range(weeks_back: int = 0) -> tuple[str, str]:
     """Return (start_date, end_date) strings for a week ending on the most recent Sunday."""
@@ -47,6 +63,9 @@ def collect() -> dict:
     returns a skeleton dict with None values so the template can show
     'N/A' instead of crashing.
     """
+    if os.environ.get("HACKATHON_COLLECTOR_FAKE"):
+        return dict(_FAKE_DATA)
+
     skeleton = {
         "available": False,
         "revenue_this_week": None,
@@ -18,6 +18,7 @@ Usage:
 from __future__ import annotations
 
 import json
+import os
 import re
 import sys
 from datetime import datetime, timedelta
@@ -38,6 +39,25 @@ DONE_DIR = VAULT_DIR / "Done"
 # Social scheduler state (tracks daily post counts)
 SOCIAL_STATE_FILE = _PROJECT_ROOT / "core" / ".social_scheduler_state.json"
 
+# Canned result returned when HACKATHON_COLLECTOR_FAKE is set (tests)
+_FAKE_DATA = {
+    "platforms": [
+        {
+            "name": name,
+            "display_name": name.capitalize(),
+            "posts": 0,
+            "impressions": 0,
+            "likes": 0,
+            "comments": 0,
+            "shares": 0,
+            "engagement_rate": 0.0,
+        }
+        for name in ("instagram", "linkedin", "twitter")
+    ],
+    "total_posts": 0,
+    "top_platform": None,
+}
+
 
 def _load_social_state() -> dict:
     """Load the social scheduler state file for post count data."""
@@ -103,6 +123,9 @@ def collect(weeks_back: int = 1) -> dict:
         total_posts: int
         top_platform: str or None
     """
+    if os.environ.get("HACKATHON_COLLECTOR_FAKE"):
+        return dict(_FAKE_DATA)
+
     cutoff = datetime.now() - timedelta(weeks=weeks_back)
 
     # Merge post counts from both sources
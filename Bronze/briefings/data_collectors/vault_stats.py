@@ -37,6 +37,18 @@ INBOX_DIR = VAULT_DIR / "Inbox"
 NEEDS_ACTION_DIR = VAULT_DIR / "Needs_Action"
 DONE_DIR = VAULT_DIR / "Done"
 
+# Canned result returned when HACKATHON_COLLECTOR_FAKE is set (tests)
+_FAKE_DATA = {
+    "inbox_count": 2,
+    "needs_action_count": 3,
+    "done_this_week": 5,
+    "new_this_week": 4,
+    "backlog": 3,
+    "avg_completion_hours": 12.0,
+    "avg_completion_days": 0.5,
+    "high_priority_items": [],
+}
+
 
 def _count_md_files(directory: Path) -> int:
     """Count .md files in a directory."""
@@ -100,6 +112,9 @@ def collect(weeks_back: int = 1) -> dict:
         new_this_week, backlog, avg_completion_hours,
         high_priority_items
     """
+    if os.environ.get("HACKATHON_COLLECTOR_FAKE"):
+        return dict(_FAKE_DATA)
+
     now = datetime.now()
     cutoff = now - timedelta(weeks=weeks_back)
 
@@ -20,6 +20,8 @@ CLI:
 from __future__ import annotations
 
 import argparse
+import functools
+import os
 import sys
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -42,37 +44,83 @@ DONE_DIR = VAULT_DIR / "Done"
 TEMPLATE_DIR = Path(__file__).resolve().parent / "templates"
 TEMPLATE_FILE = "ceo_briefing.md.j2"
 
+# Vault stage directories whose notes the collectors read, and the state
+# files they parse; a change to any of them invalidates the collected data
+_STAGE_DIRS = (
+    VAULT_DIR / "Inbox",
+    VAULT_DIR / "Needs_Action",
+    DONE_DIR,
+)
+_STATE_FILES = (
+    _PROJECT_ROOT / "core" / ".social_scheduler_state.json",
+    _PROJECT_ROOT / "logs" / "audit.log",
+)
+
 
 # ---------------------------------------------------------------------------
 # Data collection
 # ---------------------------------------------------------------------------
 
-def _collect_all() -> dict[str, Any]:
-    """Run every data collector and return a merged context dict."""
-    from briefings.data_collectors import vault_stats, financial_summary, social_metrics, email_digest
+def _dir_key(directory: Path) -> tuple:
+    """(name, mtime_ns) of every file in *directory*, so in-place edits count."""
+    try:
+        with os.scandir(directory) as it:
+            return tuple(sorted(
+                (entry.name, entry.stat().st_mtime_ns)
+                for entry in it if entry.is_file()
+            ))
+    except OSError:
+        return ()
+
+
+def _compute_key() -> tuple:
+    """Build the cache key for the vault, social and email data.
+
+    Combines the per-file mtimes of the vault stage directories and the
+    mtimes of the state files the collectors read with today's date (the
+    collectors report on a rolling week), the briefing section toggles and
+    whether the collectors are in fake-data mode.
+    """
+    state_mtimes = []
+    for path in _STATE_FILES:
+        try:
+            state_mtimes.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            state_mtimes.append(None)
 
     config.load()
     briefing_cfg = config.briefing
+    toggles = tuple(
+        bool(briefing_cfg.get(key, True))
+        for key in ("include_financials", "include_social_metrics", "include_email_digest")
+    )
+    fake = bool(os.environ.get("HACKATHON_COLLECTOR_FAKE"))
+    return (
+        datetime.now().date().isoformat(), toggles, fake,
+        *(_dir_key(d) for d in _STAGE_DIRS), *state_mtimes,
+    )
+
+
+@functools.lru_cache(maxsize=4)
+def _collect_all_cached(mtime_key: tuple) -> dict[str, Any]:
+    """Run the file-based collectors (vault, social, email)."""
+    from briefings.data_collectors import vault_stats, social_metrics, email_digest
+
+    _, include_social, include_email = mtime_key[1]
 
     data: dict[str, Any] = {}
 
     # Always collect vault stats
     data["vault"] = vault_stats.collect()
 
-    # Financial data (if configured)
-    if briefing_cfg.get("include_financials", True):
-        data["financials"] = financial_summary.collect()
-    else:
-        data["financials"] = {"available": False}
-
     # Social metrics
-    if briefing_cfg.get("include_social_metrics", True):
+    if include_social:
         data["social"] = social_metrics.collect()
     else:
         data["social"] = {"platforms": [], "total_posts": 0}
 
     # Email digest
-    if briefing_cfg.get("include_email_digest", True):
+    if include_email:
         data["email"] = email_digest.collect()
     else:
         data["email"] = {"emails_received": 0, "emails_sent": 0, "key_threads": []}
@@ -80,6 +128,27 @@ def _collect_all() -> dict[str, Any]:
     return data
 
 
+def _collect_all() -> dict[str, Any]:
+    """Run every data collector and return a merged context dict.
+
+    File-based data is reused while its sources are unchanged; financial
+    data comes from live Odoo and is fetched on every call.
+    """
+    from briefings.data_collectors import financial_summary
+
+    key = _compute_key()
+    cached = _collect_all_cached(key)
+
+    # Financial data (if configured)
+    if key[1][0]:
+        financials = financial_summary.collect()
+    else:
+        financials = {"available": False}
+
+    return {"vault": cached["vault"], "financials": financials,
+            "social": cached["social"], "email": cached["email"]}
+
+
 # ---------------------------------------------------------------------------
 # Executive summary generation
 # ---------------------------------------------------------------------------
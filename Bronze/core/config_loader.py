@@ -31,6 +31,22 @@ from typing import Any
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 CONFIG_DIR = _PROJECT_ROOT / "config"
 ENV_FILE = _PROJECT_ROOT / ".env"
+# YAML files under CONFIG_DIR and the key each is stored under in the merged
+# config (None: its top-level keys are merged in).  Drives both loading and
+# the reload fingerprint.
+CONFIG_FILES: dict[str, str | None] = {
+    "gold.yaml": None,  # scheduler, error_logging, etc.
+    "social_accounts.yaml": "social_accounts",
+    "odoo_connection.yaml": "odoo",
+}
+
+
+def _mtime_ns(path: Path) -> int | None:
+    """Modification time of *path* in ns, or None if it doesn't exist."""
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
 
 
 def _load_yaml(path: Path) -> dict:
@@ -39,8 +55,10 @@ def _load_yaml(path: Path) -> dict:
         return {}
     try:
         import yaml
+        # libyaml-backed loader when available — same safe semantics, much faster
+        loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
         with open(path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=loader)
         return data if isinstance(data, dict) else {}
     except ImportError:
         # Fallback: parse simple key: value YAML without the yaml library
@@ -136,9 +154,22 @@ class Config:
         self._data: dict[str, Any] = {}
         self._env_vars: dict[str, str] = {}
         self._loaded = False
+        self._fingerprint: tuple[int | None, ...] = ()
+
+    def _current_fingerprint(self) -> tuple[int | None, ...]:
+        paths = [ENV_FILE] + [CONFIG_DIR / name for name in CONFIG_FILES]
+        return tuple(_mtime_ns(p) for p in paths)
+
+    def load(self, force: bool = False) -> None:
+        """Load all config files.  Safe to call multiple times.
+
+        Files are only re-read when one of them has changed on disk since
+        the last load (or when *force* is set).
+        """
+        fingerprint = self._current_fingerprint()
+        if self._loaded and not force and fingerprint == self._fingerprint:
+            return
 
-    def load(self) -> None:
-        """Load all config files.  Safe to call multiple times (reloads)."""
         # Load .env into both our dict and os.environ
         self._env_vars = _load_env_file(ENV_FILE)
         for key, value in self._env_vars.items():
@@ -146,15 +177,15 @@ class Config:
                 os.environ[key] = value
 
         # Load YAML configs
-        gold = _load_yaml(CONFIG_DIR / "gold.yaml")
-        social = _load_yaml(CONFIG_DIR / "social_accounts.yaml")
-        odoo = _load_yaml(CONFIG_DIR / "odoo_connection.yaml")
-
-        self._data = {
-            **gold,  # top-level keys from gold.yaml (scheduler, error_logging, etc.)
-            "social_accounts": social,
-            "odoo": odoo,
-        }
+        data: dict[str, Any] = {}
+        for name, section in CONFIG_FILES.items():
+            values = _load_yaml(CONFIG_DIR / name)
+            if section is None:
+                data.update(values)
+            else:
+                data[section] = values
+        self._data = data
+        self._fingerprint = fingerprint
         self._loaded = True
 
     def _ensure_loaded(self) -> None:
@@ -20,19 +20,49 @@ Files:
 Alert escalation:
     3+ errors from the same source within 1 hour triggers an alert event
     on the event bus ("error.alert_triggered").
+
+Buffering:
+    Callers only encode a record and put it on a queue.  One writer thread
+    per logger drains the queue, coalesces up to 256 records (or whatever
+    arrives within ``batch_window_seconds``) per log file, and writes each
+    group with a single call through a handle kept open per file.  The
+    queue is drained before any read or rotation and at interpreter exit.
+    Call ``flush()`` to wait for everything queued so far.
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import os
+import queue
 import shutil
 import threading
 import time
 from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
+
+
+# orjson is optional and faster.  Its output is valid JSON Lines but not
+# byte-identical to the stdlib's: non-ASCII is written as UTF-8 rather than
+# \u escapes, and datetimes as RFC 3339 rather than str().  Records orjson
+# can't encode (e.g. integers wider than 64 bits) go through the stdlib.
+def _json_dumps(record: dict) -> bytes:
+    return json.dumps(record, default=str, separators=(",", ":")).encode("utf-8")
+
+
+try:
+    import orjson
+
+    def _dumps(record: dict) -> bytes:
+        try:
+            return orjson.dumps(record, default=str, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            return _json_dumps(record)
+except ImportError:
+    _dumps = _json_dumps
 
 
 # ---------------------------------------------------------------------------
@@ -44,6 +74,11 @@ ARCHIVE_DIR = LOGS_DIR / "archive"
 ERROR_LOG = LOGS_DIR / "error.log"
 AUDIT_LOG = LOGS_DIR / "audit.log"
 
+# Most records the writer thread groups into one batch
+BATCH_MAX_RECORDS = 256
+# Initial window read from the end of a log by recent_errors/recent_audit
+TAIL_CHUNK_BYTES = 8192
+
 
 class ErrorLogger:
     """Centralized JSON Lines logger with alert escalation."""
@@ -56,6 +91,7 @@ class ErrorLogger:
         alert_threshold: int = 3,
         alert_window_seconds: int = 3600,
         max_file_size_mb: int = 50,
+        batch_window_seconds: float = 0.01,
     ) -> None:
         self._error_log = error_log
         self._audit_log = audit_log
@@ -69,10 +105,26 @@ class ErrorLogger:
         self._lock = threading.Lock()
         self._event_bus = None  # set later to avoid circular import
 
+        # Background writing: callers enqueue (path, bytes); the writer
+        # thread moves them into per-file buffers and writes them out.
+        # Flush barriers are queued as (None, threading.Event).
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._buffers: dict[Path, bytearray] = {}
+        self._handles: dict[Path, Any] = {}
+        self._batch_window = batch_window_seconds
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+        # Guards the buffers and handles.  Separate from _lock so disk writes
+        # never block log_error's alert bookkeeping.
+        self._io_lock = threading.Lock()
+
         # Ensure directories exist
         self._error_log.parent.mkdir(parents=True, exist_ok=True)
+        self._audit_log.parent.mkdir(parents=True, exist_ok=True)
         self._archive_dir.mkdir(parents=True, exist_ok=True)
 
+        atexit.register(self.close)
+
     # ------------------------------------------------------------------
     # Wiring
     # ------------------------------------------------------------------
@@ -97,24 +149,53 @@ class ErrorLogger:
         Returns the record dict.
         """
         now = time.time()
-        error_str = str(error)
-        error_type = type(error).__name__ if isinstance(error, Exception) else "str"
+        record = self._error_record(source, error, context, severity, now)
 
-        record = {
+        self._append(self._error_log, record)
+        self._check_alert_escalation(source, now)
+
+        return record
+
+    def log_errors_bulk(
+        self,
+        source: str,
+        errors: Iterable[Exception | str],
+        context: dict[str, Any] | None = None,
+        severity: str = "ERROR",
+    ) -> list[dict]:
+        """Write several error records from one *source* in a single append.
+
+        Equivalent to calling ``log_error`` for each error, but the records
+        are encoded and buffered together.  Returns the record dicts.
+        """
+        now = time.time()
+        records = [self._error_record(source, e, context, severity, now) for e in errors]
+        if not records:
+            return []
+
+        self._append_many(self._error_log, records)
+        self._check_alert_escalation(source, now, count=len(records))
+
+        return records
+
+    @staticmethod
+    def _error_record(
+        source: str,
+        error: Exception | str,
+        context: dict[str, Any] | None,
+        severity: str,
+        now: float,
+    ) -> dict:
+        return {
             "ts": datetime.fromtimestamp(now).isoformat(),
             "severity": severity,
             "source": source,
-            "error_type": error_type,
-            "error": error_str,
+            "error_type": type(error).__name__ if isinstance(error, Exception) else "str",
+            "error": str(error),
             "context": context or {},
             "resolved": False,
         }
 
-        self._append(self._error_log, record)
-        self._check_alert_escalation(source, now)
-
-        return record
-
     # ------------------------------------------------------------------
     # Audit logging
     # ------------------------------------------------------------------
@@ -145,6 +226,7 @@ class ErrorLogger:
 
     def rotate_if_needed(self) -> list[str]:
         """Rotate logs that exceed max file size.  Returns list of archived filenames."""
+        self.flush()
         archived = []
         for log_path in (self._error_log, self._audit_log):
             if log_path.is_file() and log_path.stat().st_size > self._max_file_bytes:
@@ -155,6 +237,7 @@ class ErrorLogger:
 
     def force_rotate(self) -> list[str]:
         """Force rotate all logs regardless of size.  Returns list of archived filenames."""
+        self.flush()
         archived = []
         for log_path in (self._error_log, self._audit_log):
             if log_path.is_file() and log_path.stat().st_size > 0:
@@ -183,21 +266,124 @@ class ErrorLogger:
             return sum(1 for t in timestamps if t >= cutoff)
 
     # ------------------------------------------------------------------
-    # Internal helpers
+    # Buffered writing
     # ------------------------------------------------------------------
 
-    def _append(self, log_path: Path, record: dict) -> None:
-        """Thread-safe append of a JSON record to a log file."""
-        line = json.dumps(record, default=str) + "\n"
-        with self._lock:
-            with open(log_path, "a", encoding="utf-8") as f:
-                f.write(line)
+    def flush(self) -> None:
+        """Block until every record queued so far is written to disk."""
+        done = threading.Event()
+        self._ensure_writer()
+        self._queue.put((None, done))
+        # Re-check the writer while waiting: if it died, a new one drains the queue
+        while not done.wait(0.5):
+            self._ensure_writer()
+
+    def close(self) -> None:
+        """Drain the queue, stop the writer thread and close the log handles."""
+        with self._writer_lock:
+            if self._writer is not None and self._writer.is_alive():
+                self._queue.put((None, None))  # stop sentinel
+                self._writer.join()
+            self._writer = None
+        with self._io_lock:
+            for log_path in list(self._buffers):
+                self._flush_locked(log_path)
+            for log_path in list(self._handles):
+                self._close_handle_locked(log_path)
 
-    def _check_alert_escalation(self, source: str, now: float) -> None:
+    def _append(self, log_path: Path, record: dict) -> None:
+        """Queue a JSON record for the writer thread."""
+        self._append_many(log_path, [record])
+
+    def _append_many(self, log_path: Path, records: list[dict]) -> None:
+        """Queue several JSON records as one chunk for the writer thread."""
+        blob = b"".join(_dumps(r) + b"\n" for r in records)
+        if log_path not in self._handles:
+            with self._io_lock:
+                self._handle_locked(log_path)  # creates the file on first write
+        self._ensure_writer()
+        self._queue.put((log_path, blob))
+
+    def _ensure_writer(self) -> None:
+        """Start the writer thread if it is not running (first use, after close, or if it died)."""
+        writer = self._writer
+        if writer is not None and writer.is_alive():
+            return
+        with self._writer_lock:
+            if self._writer is None or not self._writer.is_alive():
+                self._writer = threading.Thread(
+                    target=self._drain, name="error-logger-writer", daemon=True,
+                )
+                self._writer.start()
+
+    def _drain(self) -> None:
+        """Writer thread: batch queued records per file and write each batch at once."""
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self._batch_window
+            while len(batch) < BATCH_MAX_RECORDS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            barriers = []
+            stop = False
+            try:
+                with self._io_lock:
+                    for log_path, payload in batch:
+                        if log_path is not None:
+                            self._buffers.setdefault(log_path, bytearray()).extend(payload)
+                        elif payload is None:
+                            stop = True
+                        else:
+                            barriers.append(payload)
+                    for log_path in list(self._buffers):
+                        self._flush_locked(log_path)
+            finally:
+                # Never leave a flush() caller waiting, even if a write blew up
+                for done in barriers:
+                    done.set()
+            if stop:
+                return
+
+    def _handle_locked(self, log_path: Path):
+        """Return the open append handle for *log_path*.  Caller holds _io_lock."""
+        fh = self._handles.get(log_path)
+        if fh is None or fh.closed:
+            fh = open(log_path, "ab", buffering=0)
+            self._handles[log_path] = fh
+        return fh
+
+    def _close_handle_locked(self, log_path: Path) -> None:
+        fh = self._handles.pop(log_path, None)
+        if fh is not None and not fh.closed:
+            fh.close()
+
+    def _flush_locked(self, log_path: Path) -> None:
+        """Write *log_path*'s buffer through its handle.  Caller holds _io_lock."""
+        buf = self._buffers.get(log_path)
+        if not buf:
+            return
+        try:
+            self._handle_locked(log_path).write(bytes(buf))
+        except OSError:
+            # The file was moved or removed underneath us — reopen once
+            self._close_handle_locked(log_path)
+            try:
+                self._handle_locked(log_path).write(bytes(buf))
+            except OSError:
+                return  # keep the buffer; the next flush retries
+        buf.clear()
+
+    def _check_alert_escalation(self, source: str, now: float, count: int = 1) -> None:
         """Track error frequency and emit alert if threshold exceeded."""
         cutoff = now - self._alert_window
         with self._lock:
-            self._recent_errors[source].append(now)
+            self._recent_errors[source].extend([now] * count)
             # Prune old entries
             self._recent_errors[source] = [
                 t for t in self._recent_errors[source] if t >= cutoff
@@ -217,29 +403,55 @@ class ErrorLogger:
         ts = datetime.now().strftime("%Y%m%d_%H%M%S")
         archive_name = f"{log_path.stem}_{ts}{log_path.suffix}"
         archive_path = self._archive_dir / archive_name
-        try:
-            shutil.move(str(log_path), str(archive_path))
+        # Close, move and reopen under one lock: a write in between would
+        # reopen the old path, and the move would leave that handle on the
+        # archive.  Reopening creates the fresh log before anyone else writes.
+        with self._io_lock:
+            self._close_handle_locked(log_path)
+            try:
+                shutil.move(str(log_path), str(archive_path))
+            except OSError:
+                return None
+            try:
+                self._handle_locked(log_path)
+            except OSError:
+                pass  # the next write retries
             return archive_name
-        except OSError:
-            return None
 
     def _tail(self, log_path: Path, limit: int) -> list[dict]:
-        """Read the last *limit* lines from a JSON Lines file."""
-        if not log_path.is_file():
+        """Read the last *limit* lines from a JSON Lines file.
+
+        Seeks backwards from the end of the file, doubling the window until
+        it holds *limit* complete lines, so only the tail is read.
+        """
+        self.flush()
+        if limit <= 0 or not log_path.is_file():
             return []
         try:
-            lines = log_path.read_text(encoding="utf-8").strip().splitlines()
-            tail = lines[-limit:] if len(lines) > limit else lines
-            results = []
-            for line in tail:
-                try:
-                    results.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-            return results
+            with open(log_path, "rb") as f:
+                size = f.seek(0, os.SEEK_END)
+                window = TAIL_CHUNK_BYTES * max(1, limit // 20)
+                while True:
+                    start = max(0, size - window)
+                    f.seek(start)
+                    lines = f.read().split(b"\n")
+                    if start > 0:
+                        lines = lines[1:]  # first line may be cut mid-record
+                    lines = [line for line in lines if line.strip()]
+                    if start == 0 or len(lines) >= limit:
+                        break
+                    window *= 2
         except OSError:
             return []
 
+        results = []
+        for line in lines[-limit:]:
+            try:
+                results.append(json.loads(line))
+            except (json.JSONDecodeError, UnicodeDecodeError):
+                continue
+        return results
+
 
 # ---------------------------------------------------------------------------
 # Module-level singleton
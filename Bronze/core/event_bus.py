@@ -25,7 +25,7 @@ from __future__ import annotations
 import fnmatch
 import threading
 import time
-from collections import defaultdict
+from collections import defaultdict, deque
 from dataclasses import dataclass, field
 from typing import Any, Callable
 
@@ -43,14 +43,52 @@ class _EventRecord:
     errors: list[str] = field(default_factory=list)
 
 
+class _PatternNode:
+    """Trie node for trailing-wildcard patterns, keyed by dot-separated segment.
+
+    Handlers stored on a node fire for any event that extends the node's
+    prefix by at least one more segment — the same events ``fnmatch``
+    would match for ``"<prefix>.*"``.
+    """
+
+    __slots__ = ("children", "handlers")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _PatternNode] = {}
+        self.handlers: list[tuple[int, str, Handler]] = []  # (seq, pattern, handler)
+
+
+def _trie_prefix(pattern: str) -> list[str] | None:
+    """Segments before a trailing ``.*`` / ``.**``, or None if *pattern* needs fnmatch.
+
+    ``"*"`` and ``"**"`` match every event and map to the root (empty prefix).
+    """
+    if pattern in ("*", "**"):
+        return []
+    for suffix in (".**", ".*"):
+        if pattern.endswith(suffix):
+            prefix = pattern[:-len(suffix)]
+            if prefix and not any(c in prefix for c in "*?["):
+                return prefix.split(".")
+            return None
+    return None
+
+
 class EventBus:
     """Simple synchronous pub/sub event bus with wildcard support."""
 
     def __init__(self, max_history: int = 200) -> None:
-        self._handlers: dict[str, list[Handler]] = defaultdict(list)
-        self._wildcard_handlers: list[tuple[str, Handler]] = []
-        self._history: list[_EventRecord] = []
-        self._max_history = max_history
+        # topic -> {handler: None}, used as an ordered set: insertion order,
+        # O(1) unsubscribe, and equality lookups so a bound method (a new
+        # object on every attribute access) can still be removed.
+        self._handlers: dict[str, dict[Handler, None]] = defaultdict(dict)
+        # Trailing-wildcard patterns ("odoo.*") live in a segment trie so emit
+        # walks O(event depth) nodes; anything else ("*.failed") is fnmatched.
+        self._pattern_root = _PatternNode()
+        self._glob_handlers: list[tuple[int, str, Handler]] = []
+        self._pattern_seq = 0  # registration order across trie + glob handlers
+        # Bounded ring: appends past max_history drop the oldest record
+        self._history: deque[_EventRecord] = deque(maxlen=max_history)
         self._lock = threading.Lock()
         self._error_logger = None  # set after error_logger is initialised
 
@@ -67,30 +105,60 @@ class EventBus:
 
         Patterns can be exact (``"vault.task.new"``) or use ``*`` /
         ``**`` wildcards (``"odoo.*"``, ``"social.**"``).
+
+        A handler is registered at most once per pattern: subscribing an
+        equal handler (``==``, so the same function or bound method) to the
+        same pattern again is a no-op, for exact and wildcard patterns alike.
         """
         with self._lock:
             if "*" in event_pattern or "?" in event_pattern:
-                self._wildcard_handlers.append((event_pattern, handler))
+                prefix = _trie_prefix(event_pattern)
+                if prefix is None:
+                    entries = self._glob_handlers
+                else:
+                    node = self._pattern_root
+                    for segment in prefix:
+                        node = node.children.setdefault(segment, _PatternNode())
+                    entries = node.handlers
+                if any(e[1] == event_pattern and e[2] == handler for e in entries):
+                    return
+                self._pattern_seq += 1
+                entries.append((self._pattern_seq, event_pattern, handler))
             else:
-                self._handlers[event_pattern].append(handler)
+                self._handlers[event_pattern][handler] = None
 
     def off(self, event_pattern: str, handler: Handler) -> bool:
         """Remove *handler* from *event_pattern*.  Returns True if found."""
         with self._lock:
             if "*" in event_pattern or "?" in event_pattern:
-                before = len(self._wildcard_handlers)
-                self._wildcard_handlers = [
-                    (p, h) for p, h in self._wildcard_handlers
-                    if not (p == event_pattern and h is handler)
+                prefix = _trie_prefix(event_pattern)
+                if prefix is None:
+                    before = len(self._glob_handlers)
+                    self._glob_handlers = [
+                        e for e in self._glob_handlers
+                        if not (e[1] == event_pattern and e[2] == handler)
+                    ]
+                    return len(self._glob_handlers) < before
+
+                node = self._pattern_root
+                for segment in prefix:
+                    node = node.children.get(segment)
+                    if node is None:
+                        return False
+                before = len(node.handlers)
+                node.handlers = [
+                    e for e in node.handlers
+                    if not (e[1] == event_pattern and e[2] == handler)
                 ]
-                return len(self._wildcard_handlers) < before
+                return len(node.handlers) < before
 
-            handlers = self._handlers.get(event_pattern, [])
-            try:
-                handlers.remove(handler)
-                return True
-            except ValueError:
+            handlers = self._handlers.get(event_pattern)
+            if not handlers:
+                return False
+            if handler not in handlers:
                 return False
+            del handlers[handler]
+            return True
 
     def emit(self, event: str, data: dict[str, Any] | None = None) -> _EventRecord:
         """Publish *event* with optional *data* dict.
@@ -103,10 +171,8 @@ class EventBus:
         record = _EventRecord(event=event, data=data, timestamp=time.time())
 
         with self._lock:
-            targets: list[Handler] = list(self._handlers.get(event, []))
-            for pattern, handler in self._wildcard_handlers:
-                if fnmatch.fnmatch(event, pattern):
-                    targets.append(handler)
+            targets: list[Handler] = list(self._handlers.get(event, {}))
+            targets.extend(self._match_patterns_locked(event))
 
         for handler in targets:
             try:
@@ -119,25 +185,22 @@ class EventBus:
 
         with self._lock:
             self._history.append(record)
-            if len(self._history) > self._max_history:
-                self._history = self._history[-self._max_history:]
 
         return record
 
     def handlers_for(self, event: str) -> list[Handler]:
         """Return all handlers that would fire for *event* (for testing)."""
         with self._lock:
-            result = list(self._handlers.get(event, []))
-            for pattern, handler in self._wildcard_handlers:
-                if fnmatch.fnmatch(event, pattern):
-                    result.append(handler)
+            result = list(self._handlers.get(event, {}))
+            result.extend(self._match_patterns_locked(event))
         return result
 
     def clear(self) -> None:
         """Remove all handlers and history (mainly for tests)."""
         with self._lock:
             self._handlers.clear()
-            self._wildcard_handlers.clear()
+            self._pattern_root = _PatternNode()
+            self._glob_handlers.clear()
             self._history.clear()
 
     @property
@@ -150,6 +213,24 @@ class EventBus:
     # Internal
     # ------------------------------------------------------------------
 
+    def _match_patterns_locked(self, event: str) -> list[Handler]:
+        """Wildcard handlers matching *event*, in registration order.  Caller holds the lock."""
+        matched = list(self._pattern_root.handlers)
+        node = self._pattern_root
+        # A prefix only matches when the event has at least one more segment
+        for segment in event.split(".")[:-1]:
+            node = node.children.get(segment)
+            if node is None:
+                break
+            matched.extend(node.handlers)
+
+        for entry in self._glob_handlers:
+            if fnmatch.fnmatch(event, entry[1]):
+                matched.append(entry)
+
+        matched.sort(key=lambda e: e[0])
+        return [handler for _, _, handler in matched]
+
     def _report_error(self, event: str, handler: Handler, exc: Exception) -> None:
         """Forward handler errors to the error logger if available."""
         handler_name = getattr(handler, "__name__", repr(handler))
@@ -16,6 +16,7 @@ CLI:
 
 from __future__ import annotations
 
+import functools
 import importlib
 import os
 import sys
@@ -194,8 +195,37 @@ def _check_python_packages() -> list[Check]:
     return checks
 
 
+# Packages whose sources key the module-import cache
+_MODULE_DIRS = ("core", "integrations", "briefings", "mcp_servers")
+
+
+def _source_fingerprint() -> int:
+    """Hash of (path, mtime_ns) for every .py file in the Gold Tier packages."""
+    entries = []
+    for dirname in _MODULE_DIRS:
+        for path in (_PROJECT_ROOT / dirname).rglob("*.py"):
+            try:
+                entries.append((str(path), path.stat().st_mtime_ns))
+            except OSError:
+                continue
+    return hash(tuple(sorted(entries)))
+
+
+def clear_cache() -> None:
+    """Forget cached module-import results (e.g. after installing a package)."""
+    _check_core_modules_cached.cache_clear()
+
+
 def _check_core_modules() -> list[Check]:
-    """Verify all Gold Tier core modules import successfully."""
+    """Verify all Gold Tier core modules import successfully.
+
+    Results are cached until a source file in the Gold Tier packages changes.
+    """
+    return list(_check_core_modules_cached(_source_fingerprint()))
+
+
+@functools.lru_cache(maxsize=4)
+def _check_core_modules_cached(fingerprint: int) -> tuple[Check, ...]:
     checks = []
 
     modules = [
@@ -243,7 +273,7 @@ def _check_core_modules() -> list[Check]:
                 f"{type(e).__name__}: {e}",
             ))
 
-    return checks
+    return tuple(checks)
 
 
 def _check_mcp_config() -> list[Check]:
@@ -37,6 +37,7 @@ CLI:
 from __future__ import annotations
 
 import argparse
+import functools
 import json
 import sys
 from dataclasses import asdict
@@ -68,8 +69,15 @@ HISTORY_FILE = _PROJECT_ROOT / "core" / ".social_post_history.json"
 
 
 def _get_platform(name: str) -> SocialPlatform | None:
-    """Lazily import and instantiate a platform by name."""
-    name = name.lower().strip()
+    """Return the shared platform instance for *name* (None if unknown).
+
+    Each platform is imported and constructed once per process.
+    """
+    return _platform_instance(name.lower().strip())
+
+
+@functools.lru_cache(maxsize=8)
+def _platform_instance(name: str) -> SocialPlatform | None:
     if name == "facebook":
         from integrations.social.facebook import FacebookPlatform
         return FacebookPlatform()
@@ -97,10 +97,11 @@ class SocialPlatform(ABC):
 
     def validate_content(self, content: str) -> str | None:
         """Validate content before posting. Returns error message or None if valid."""
-        if not content.strip():
+        if not content or content.isspace():
             return "Post content cannot be empty"
-        if len(content) > self.char_limit:
-            return f"Content exceeds {self.char_limit} character limit ({len(content)} chars)"
+        length = len(content)
+        if length > self.char_limit:
+            return f"Content exceeds {self.char_limit} character limit ({length} chars)"
         return None
 
     def __repr__(self) -> str:
@@ -24,6 +24,7 @@ Usage:
 
 from __future__ import annotations
 
+import os
 import re
 import sys
 from datetime import datetime
@@ -47,30 +48,63 @@ DONE_DIR = VAULT_DIR / "Done"
 SOCIAL_PREFIX = "social_"
 VALID_STATUSES = {"draft", "approved", "scheduled", "posted", "failed"}
 
+# Leading "---" block, then the body
+_FRONTMATTER_RE = re.compile(r"^---\s*\n(.*?)\n---\s*\n(.*)", re.DOTALL)
+
+# scan() reads this much of each file to find the frontmatter block
+_HEAD_BYTES = 2048
+
 
 def _parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
     """Parse YAML-style frontmatter from a markdown file.
 
     Returns (metadata_dict, body_content).
     """
-    meta: dict[str, Any] = {}
-    body = content
-
-    match = re.match(r"^---\s*\n(.*?)\n---\s*\n(.*)", content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
     if not match:
-        return meta, body
+        return {}, content
+    return _parse_meta(match.group(1)), match.group(2).strip()
+
+
+def _read_frontmatter_head(path: Path) -> tuple[dict[str, Any], str | None]:
+    """Read only the start of *path* to get its frontmatter.
+
+    Returns (metadata_dict, body) — body is None when the file is larger
+    than the head that was read, so callers can load it on demand.  Falls
+    back to a full read if the frontmatter doesn't close within the head.
+    """
+    with open(path, "rb") as f:
+        head = f.read(_HEAD_BYTES + 1)
+
+    if len(head) <= _HEAD_BYTES:
+        return _parse_frontmatter(_universal_newlines(head.decode("utf-8")))
 
-    frontmatter_text = match.group(1)
-    body = match.group(2).strip()
+    # A multi-byte character may be cut at the boundary — only the body
+    # can be affected, and it is not used from the head.
+    match = _FRONTMATTER_RE.match(
+        _universal_newlines(head[:_HEAD_BYTES].decode("utf-8", errors="ignore"))
+    )
+    if match:
+        return _parse_meta(match.group(1)), None
+    return _parse_frontmatter(path.read_text(encoding="utf-8"))
 
+
+def _universal_newlines(text: str) -> str:
+    """Translate \r\n and \r to \n, as read_text() does."""
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text
+
+
+def _parse_meta(frontmatter_text: str) -> dict[str, Any]:
+    """Parse the ``key: value`` lines of a frontmatter block."""
+    meta: dict[str, Any] = {}
     for line in frontmatter_text.splitlines():
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-        if ":" not in line:
+        key, sep, value = line.partition(":")
+        key = key.strip()
+        if not sep or not key or key.startswith("#"):
             continue
-        key, _, value = line.partition(":")
-        key = key.strip().lower()
+        key = key.lower()
         value = value.strip()
 
         # Parse lists (comma-separated)
@@ -79,7 +113,7 @@ def _parse_frontmatter(content: str) -> tuple[dict[str, Any], str]:
         else:
             meta[key] = value
 
-    return meta, body
+    return meta
 
 
 def _write_frontmatter(meta: dict[str, Any], body: str) -> str:
@@ -98,11 +132,18 @@ def _write_frontmatter(meta: dict[str, Any], body: str) -> str:
 class ContentItem:
     """A single piece of social content from the queue."""
 
-    def __init__(self, path: Path, meta: dict[str, Any], body: str) -> None:
+    def __init__(self, path: Path, meta: dict[str, Any], body: str | None = None) -> None:
         self.path = path
         self.filename = path.name
         self.meta = meta
-        self.body = body
+        self._body = body
+
+    @property
+    def body(self) -> str:
+        """Post content; read from disk on first access if scan() skipped it."""
+        if self._body is None:
+            _, self._body = _parse_frontmatter(self.path.read_text(encoding="utf-8"))
+        return self._body
 
     @property
     def platforms(self) -> list[str]:
@@ -148,16 +189,24 @@ class ContentQueue:
     def scan(self) -> list[ContentItem]:
         """Scan for all social content files in Needs_Action/."""
         items = []
-        if not self.queue_dir.is_dir():
+        try:
+            with os.scandir(self.queue_dir) as it:
+                names = sorted(
+                    entry.name for entry in it
+                    if entry.name.startswith(SOCIAL_PREFIX)
+                    and entry.name.endswith(".md")
+                    and entry.is_file()
+                )
+        except OSError:
             return items
 
-        for md_file in sorted(self.queue_dir.glob(f"{SOCIAL_PREFIX}*.md")):
+        for name in names:
+            md_file = self.queue_dir / name
             try:
-                content = md_file.read_text(encoding="utf-8")
-                meta, body = _parse_frontmatter(content)
+                meta, body = _read_frontmatter_head(md_file)
                 items.append(ContentItem(md_file, meta, body))
-            except OSError as e:
-                error_logger.log_error("social.queue.scan", e, {"file": md_file.name})
+            except (OSError, UnicodeDecodeError) as e:
+                error_logger.log_error("social.queue.scan", e, {"file": name})
 
         return items
 
@@ -49,12 +49,18 @@ class SocialScheduler:
         platform_today = daily.get(platform, {}).get(today, 0)
         return platform_today < limit
 
-    def record_post(self, platform: str) -> None:
-        """Record that a post was made on this platform today."""
+    def record_post(self, platform: str, count: int = 1) -> None:
+        """Record that *count* posts were made on this platform today.
+
+        Threads pass the number of tweets posted so the state file is
+        rewritten once per batch rather than once per tweet.
+        """
+        if count <= 0:
+            return
         today = datetime.now().strftime("%Y-%m-%d")
         daily = self._state.setdefault("daily_posts", {})
         platform_data = daily.setdefault(platform, {})
-        platform_data[today] = platform_data.get(today, 0) + 1
+        platform_data[today] = platform_data.get(today, 0) + count
 
         # Clean up old dates (keep only last 7 days)
         cutoff = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
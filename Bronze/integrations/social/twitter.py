@@ -28,7 +28,11 @@ Usage:
 
 from __future__ import annotations
 
+import re
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -48,6 +52,17 @@ MEDIA_UPLOAD_URL = "https://upload.twitter.com/1.1/media/upload.json"
 USER_TWEETS_URL = "https://api.twitter.com/2/users/{user_id}/tweets"
 USER_ME_URL = "https://api.twitter.com/2/users/me"
 
+# X wraps every link in a t.co URL of this length when counting characters
+TCO_URL_LENGTH = 23
+_URL_RE = re.compile(r"https?://\S+")
+
+# Tweet lookup accepts up to 100 IDs per request
+METRICS_BATCH_SIZE = 100
+METRICS_MAX_WORKERS = 4
+# Pause once fewer than this fraction of the rate-limit window remains
+RATE_LIMIT_LOW_WATER = 0.1
+RATE_LIMIT_MAX_WAIT_SECONDS = 900
+
 
 class TwitterPlatform(SocialPlatform):
     """X/Twitter posting via API v2 with OAuth 1.0a."""
@@ -64,6 +79,20 @@ class TwitterPlatform(SocialPlatform):
         self.access_secret = config.env("TWITTER_ACCESS_SECRET", "")
         self._auth = None
         self._user_id: str | None = None
+        self._rate_lock = threading.Lock()
+        self._rate_resume_at = 0.0
+
+    def validate_content(self, content: str) -> str | None:
+        """Validate tweet text, counting each link as a t.co URL."""
+        if not content or content.isspace():
+            return "Post content cannot be empty"
+        length = len(content)
+        if "://" in content:
+            for url in _URL_RE.findall(content):
+                length += TCO_URL_LENGTH - len(url)
+        if length > self.char_limit:
+            return f"Content exceeds {self.char_limit} character limit ({length} chars)"
+        return None
 
     def authenticate(self) -> bool:
         """Set up OAuth 1.0a authentication."""
@@ -358,20 +387,46 @@ class TwitterPlatform(SocialPlatform):
         return MetricsResult(platform=self.platform_name, post_id=post_id)
 
     def get_metrics_batch(self, post_ids: list[str]) -> list[MetricsResult]:
-        """Fetch metrics for multiple tweets in a single API call (up to 100)."""
+        """Fetch metrics for multiple tweets, 100 IDs per API call.
+
+        Chunks are fetched on a small thread pool.  When the rate-limit
+        headers show the window is nearly spent, further requests wait
+        for the reset instead of running into HTTP 429.
+        """
         if not post_ids or not self.authenticate():
             return []
 
+        chunks = [
+            post_ids[i:i + METRICS_BATCH_SIZE]
+            for i in range(0, len(post_ids), METRICS_BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            return self._fetch_metrics_chunk(chunks[0])
+
+        results: list[MetricsResult] = []
+        with ThreadPoolExecutor(max_workers=min(METRICS_MAX_WORKERS, len(chunks))) as pool:
+            for chunk_results in pool.map(self._fetch_metrics_chunk, chunks):
+                results.extend(chunk_results)
+        return results
+
+    def _fetch_metrics_chunk(self, ids: list[str]) -> list[MetricsResult]:
+        """Look up public metrics for up to 100 tweet IDs in one request.
+
+        A chunk that hits HTTP 429 is retried once after the rate-limit reset.
+        """
         try:
             import requests
 
-            # v2 allows comma-separated IDs lookup
-            ids_str = ",".join(post_ids[:100])
             params = {
-                "ids": ids_str,
+                "ids": ",".join(ids),
                 "tweet.fields": "public_metrics,created_at",
             }
-            resp = requests.get(TWEET_LOOKUP_URL, auth=self._auth, params=params, timeout=30)
+            for attempt in range(2):
+                self._wait_for_rate_limit()
+                resp = requests.get(TWEET_LOOKUP_URL, auth=self._auth, params=params, timeout=30)
+                self._note_rate_limit(resp.status_code, resp.headers)
+                if resp.status_code != 429 or attempt == 1:
+                    break
 
             if resp.status_code == 200:
                 results = []
@@ -387,11 +442,41 @@ class TwitterPlatform(SocialPlatform):
                     ))
                 return results
 
+            error_logger.log_error("social.twitter.metrics_batch",
+                f"HTTP {resp.status_code}", {"ids": len(ids)})
+
+        except ImportError:
+            pass
         except Exception as e:
             error_logger.log_error("social.twitter.metrics_batch", e)
 
         return []
 
+    # ------------------------------------------------------------------
+    # Rate-limit backoff
+    # ------------------------------------------------------------------
+
+    def _note_rate_limit(self, status_code: int, headers) -> None:
+        """Record when to resume if the x-rate-limit-* headers say we're close."""
+        try:
+            limit = int(headers.get("x-rate-limit-limit", 0))
+            remaining = int(headers.get("x-rate-limit-remaining", limit))
+            reset_at = float(headers.get("x-rate-limit-reset", 0))
+        except (TypeError, ValueError):
+            return
+
+        exhausted = status_code == 429 or (limit and remaining < limit * RATE_LIMIT_LOW_WATER)
+        if exhausted and reset_at:
+            with self._rate_lock:
+                self._rate_resume_at = max(self._rate_resume_at, reset_at)
+
+    def _wait_for_rate_limit(self) -> None:
+        """Sleep until the rate-limit window resets, if a pause was recorded."""
+        with self._rate_lock:
+            delay = self._rate_resume_at - time.time()
+        if delay > 0:
+            time.sleep(min(delay, RATE_LIMIT_MAX_WAIT_SECONDS))
+
     # ------------------------------------------------------------------
     # User timeline
     # ------------------------------------------------------------------
@@ -0,0 +1,100 @@
+"""
+MCP Tool Manifest Snapshot
+===========================
+Records which tools each Gold MCP server registers, so the test suite can
+check tool counts without importing the servers (and the ``mcp`` package).
+
+Tools are read statically from the ``@mcp.tool()`` decorators in each
+server module.  The snapshot also stores a SHA-256 of every server source,
+and the tests fail with a hint to re-run this script when they drift.
+
+Run:
+    python scripts/snapshot_mcp_tools.py           # rewrite tests/_mcp_tools.json
+    python scripts/snapshot_mcp_tools.py --check   # exit 1 if the snapshot is stale
+"""
+
+from __future__ import annotations
+
+import argparse
+import ast
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+MCP_DIR = _PROJECT_ROOT / "mcp_servers"
+SNAPSHOT_FILE = _PROJECT_ROOT / "tests" / "_mcp_tools.json"
+
+# Servers covered by the Gold test suite
+SERVERS = ("vault_server", "email_server", "accounting_server", "social_server", "briefing_server")
+
+
+def _is_tool_decorator(node: ast.expr) -> bool:
+    """True for ``@mcp.tool()`` / ``@mcp.tool``."""
+    target = node.func if isinstance(node, ast.Call) else node
+    return isinstance(target, ast.Attribute) and target.attr == "tool"
+
+
+def _tool_name(func: ast.FunctionDef | ast.AsyncFunctionDef, decorator: ast.expr) -> str:
+    """Registered tool name: an explicit ``name=`` argument, else the function name."""
+    if isinstance(decorator, ast.Call):
+        for kw in decorator.keywords:
+            if kw.arg == "name" and isinstance(kw.value, ast.Constant):
+                return kw.value.value
+    return func.name
+
+
+def source_hash(server: str) -> str:
+    """SHA-256 of a server's source, with line endings normalised (CRLF checkouts)."""
+    data = (MCP_DIR / f"{server}.py").read_bytes().replace(b"\r\n", b"\n")
+    return hashlib.sha256(data).hexdigest()
+
+
+def tools_for(server: str) -> list[str]:
+    """Tool names registered by *server*, in definition order."""
+    tree = ast.parse((MCP_DIR / f"{server}.py").read_text(encoding="utf-8"))
+    names = []
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        for decorator in node.decorator_list:
+            if _is_tool_decorator(decorator):
+                names.append(_tool_name(node, decorator))
+                break
+    return names
+
+
+def build_snapshot() -> dict:
+    return {
+        "servers": {server: tools_for(server) for server in SERVERS},
+        "sources": {server: source_hash(server) for server in SERVERS},
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Snapshot the tools registered by each MCP server.")
+    parser.add_argument("--check", action="store_true", help="Exit 1 if the snapshot is out of date")
+    args = parser.parse_args()
+
+    snapshot = build_snapshot()
+
+    if args.check:
+        try:
+            current = json.loads(SNAPSHOT_FILE.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            current = None
+        if current != snapshot:
+            print(f"[STALE] {SNAPSHOT_FILE.name} — run: python scripts/snapshot_mcp_tools.py")
+            return 1
+        print(f"[OK] {SNAPSHOT_FILE.name} is up to date")
+        return 0
+
+    SNAPSHOT_FILE.write_text(json.dumps(snapshot, indent=2) + "\n", encoding="utf-8")
+    total = sum(len(tools) for tools in snapshot["servers"].values())
+    print(f"[OK] Wrote {SNAPSHOT_FILE.name}: {total} tools across {len(SERVERS)} servers")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
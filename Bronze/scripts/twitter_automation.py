@@ -34,7 +34,9 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
+import os
 import sys
 from dataclasses import asdict
 from datetime import datetime, timedelta
@@ -60,46 +62,128 @@ DONE_DIR = VAULT_DIR / "Done"
 TWITTER_LOG_DIR = DONE_DIR / "twitter_logs"
 TWITTER_REPORT_DIR = DONE_DIR / "twitter_reports"
 
-# Post history persistence
-HISTORY_FILE = _PROJECT_ROOT / "core" / ".twitter_post_history.json"
+# Project-relative forms, resolved once for the "Vault log:" / "Report:" output
+_TWITTER_LOG_REL = TWITTER_LOG_DIR.relative_to(_PROJECT_ROOT)
+_TWITTER_REPORT_REL = TWITTER_REPORT_DIR.relative_to(_PROJECT_ROOT)
+
+# Post history persistence — JSON Lines, appended one entry per tweet
+HISTORY_FILE = _PROJECT_ROOT / "core" / ".twitter_post_history.jsonl"
+# Pre-JSONL history (one JSON list); folded into HISTORY_FILE on compaction
+_LEGACY_HISTORY_FILE = _PROJECT_ROOT / "core" / ".twitter_post_history.json"
+HISTORY_RETENTION_DAYS = 90
+
+# Number of tweets listed in the report's top-tweets table
+TOP_TWEETS = 5
 
 
 # ---------------------------------------------------------------------------
 # History management
 # ---------------------------------------------------------------------------
 
-def _load_history() -> list[dict]:
-    if HISTORY_FILE.is_file():
+def _read_history() -> list[dict]:
+    """Read every stored history entry (legacy JSON + JSONL), oldest first."""
+    history: list[dict] = []
+    if _LEGACY_HISTORY_FILE.is_file():
         try:
-            return json.loads(HISTORY_FILE.read_text(encoding="utf-8"))
+            history.extend(json.loads(_LEGACY_HISTORY_FILE.read_text(encoding="utf-8")))
         except (json.JSONDecodeError, OSError):
             pass
-    return []
+
+    if HISTORY_FILE.is_file():
+        try:
+            with open(HISTORY_FILE, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        history.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue
+        except OSError:
+            pass
+    return history
+
+
+def _load_history() -> list[dict]:
+    """Read history entries within the retention window, oldest first."""
+    cutoff = (datetime.now() - timedelta(days=HISTORY_RETENTION_DAYS)).isoformat()
+    return [h for h in _read_history() if h.get("timestamp", "") >= cutoff]
 
 
-def _save_history(history: list[dict]) -> None:
-    # Keep 90 days
-    cutoff = (datetime.now() - timedelta(days=90)).isoformat()
-    history = [h for h in history if h.get("timestamp", "") >= cutoff]
+def _append_history(entries: list[dict]) -> None:
+    """Append *entries* to the history file in a single write."""
+    if not entries:
+        return
+    blob = "".join(json.dumps(e, default=str) + "\n" for e in entries)
     try:
-        HISTORY_FILE.write_text(json.dumps(history, indent=2, default=str), encoding="utf-8")
+        with open(HISTORY_FILE, "a", encoding="utf-8") as f:
+            f.write(blob)
     except OSError as e:
         error_logger.log_error("twitter.history_save", e)
 
 
-def _record(history: list[dict], tweet_id: str | None, content: str,
-            success: bool, error: str | None = None, **extra) -> None:
-    history.append({
+def _compact_history() -> list[dict]:
+    """Drop expired entries from the history file and return the rest.
+
+    Rewrites the file only when something expired or the legacy JSON file
+    still exists (its entries are carried over and the file removed).  The
+    new file is written alongside and swapped in with os.replace, so a
+    failed write leaves the old history intact; lines another run appended
+    while compacting are copied across before the swap.
+    """
+    try:
+        read_size = HISTORY_FILE.stat().st_size
+    except OSError:
+        read_size = 0
+    stored = _read_history()
+    cutoff = (datetime.now() - timedelta(days=HISTORY_RETENTION_DAYS)).isoformat()
+    history = [h for h in stored if h.get("timestamp", "") >= cutoff]
+    if len(history) == len(stored) and not _LEGACY_HISTORY_FILE.is_file():
+        return history
+
+    blob = "".join(json.dumps(h, default=str) + "\n" for h in history)
+    tmp_path = HISTORY_FILE.with_name(HISTORY_FILE.name + ".tmp")
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(blob.encode("utf-8"))
+            try:
+                with open(HISTORY_FILE, "rb") as current:
+                    current.seek(read_size)
+                    f.write(current.read())
+            except FileNotFoundError:
+                pass
+        os.replace(tmp_path, HISTORY_FILE)
+        _LEGACY_HISTORY_FILE.unlink(missing_ok=True)
+    except OSError as e:
+        tmp_path.unlink(missing_ok=True)
+        error_logger.log_error("twitter.history_save", e)
+    return history
+
+
+def _history_entry(tweet_id: str | None, content: str, success: bool,
+                   error: str | None = None, timestamp: str | None = None,
+                   **extra) -> dict:
+    """Build a history entry.
+
+    Pass *timestamp* to share one ISO timestamp across a batch (e.g. a thread).
+    """
+    return {
         "tweet_id": tweet_id,
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": timestamp or datetime.now().isoformat(),
         "content_preview": content[:140],
         "content_length": len(content),
         "success": success,
         "error": error,
         "url": f"https://x.com/i/web/status/{tweet_id}" if tweet_id else None,
         **extra,
-    })
-    _save_history(history)
+    }
+
+
+def _record(tweet_id: str | None, content: str, success: bool,
+            error: str | None = None, **extra) -> None:
+    """Append a single history entry without reading the existing history."""
+    _append_history([_history_entry(tweet_id, content, success, error, **extra)])
 
 
 # ---------------------------------------------------------------------------
@@ -203,7 +287,6 @@ def cmd_tweet(content: str, media_paths: list[str] | None = None) -> None:
     """Post a single tweet."""
     tw = TwitterPlatform()
     scheduler = SocialScheduler()
-    history = _load_history()
 
     if not scheduler.can_post("twitter"):
         print(f"[SKIP] Rate limit reached ({scheduler.posts_today('twitter')} "
@@ -216,7 +299,7 @@ def cmd_tweet(content: str, media_paths: list[str] | None = None) -> None:
     if result.success:
         scheduler.record_post("twitter")
 
-    _record(history, result.post_id, content, result.success, result.error,
+    _record(result.post_id, content, result.success, result.error,
             has_media=bool(media))
 
     vault_path = _log_tweet_to_vault(content, result,
@@ -226,14 +309,13 @@ def cmd_tweet(content: str, media_paths: list[str] | None = None) -> None:
     print(f"[{status}] Tweet: {result.post_id or result.error}")
     if result.url:
         print(f"  URL: {result.url}")
-    print(f"  Vault log: {vault_path.relative_to(_PROJECT_ROOT)}")
+    print(f"  Vault log: {_TWITTER_LOG_REL / vault_path.name}")
 
 
 def cmd_thread(parts: list[str]) -> None:
     """Post a multi-tweet thread."""
     tw = TwitterPlatform()
     scheduler = SocialScheduler()
-    history = _load_history()
 
     if not scheduler.can_post("twitter"):
         print("[SKIP] Rate limit reached for today")
@@ -241,23 +323,32 @@ def cmd_thread(parts: list[str]) -> None:
 
     print(f"Posting thread ({len(parts)} tweets)...")
     results = tw.post_thread(parts)
+    batch_ts = datetime.now().isoformat()
 
+    successful = 0
+    entries: list[dict] = []
     for i, (text, result) in enumerate(zip(parts, results)):
         status = "OK" if result.success else "FAIL"
         print(f"  [{status}] Tweet {i+1}: {result.post_id or result.error}")
 
         if result.success:
-            scheduler.record_post("twitter")
-            _record(history, result.post_id, text, True,
-                    thread_position=i + 1, thread_length=len(parts))
+            successful += 1
+            entries.append(_history_entry(
+                result.post_id, text, True, timestamp=batch_ts,
+                thread_position=i + 1, thread_length=len(parts)))
         else:
-            _record(history, None, text, False, result.error,
-                    thread_position=i + 1, thread_length=len(parts))
+            entries.append(_history_entry(
+                None, text, False, result.error, timestamp=batch_ts,
+                thread_position=i + 1, thread_length=len(parts)))
+
+    # One write each for the scheduler state and the history file,
+    # instead of one per tweet in the thread.
+    scheduler.record_post("twitter", count=successful)
+    _append_history(entries)
 
     vault_path = _log_thread_to_vault(parts, results)
-    successful = sum(1 for r in results if r.success)
     print(f"\nThread: {successful}/{len(parts)} posted")
-    print(f"Vault log: {vault_path.relative_to(_PROJECT_ROOT)}")
+    print(f"Vault log: {_TWITTER_LOG_REL / vault_path.name}")
 
 
 def cmd_metrics(tweet_id: str) -> None:
@@ -276,7 +367,8 @@ def cmd_metrics(tweet_id: str) -> None:
 def cmd_report(days: int = 7) -> None:
     """Generate a weekly engagement report and save to vault."""
     tw = TwitterPlatform()
-    history = _load_history()
+    # Reports are infrequent — a good moment to drop expired entries
+    history = _compact_history()
 
     cutoff = (datetime.now() - timedelta(days=days)).isoformat()
     recent = [h for h in history if h.get("timestamp", "") >= cutoff and h.get("success")]
@@ -334,7 +426,7 @@ def cmd_report(days: int = 7) -> None:
     if total_impressions > 0:
         eng = (total_likes + total_replies + total_retweets) / total_impressions * 100
         print(f"  Engagement rate: {eng:.2f}%")
-    print(f"\n  Report: {report_path.relative_to(_PROJECT_ROOT)}")
+    print(f"\n  Report: {_TWITTER_REPORT_REL / report_path.name}")
 
 
 def _write_report_to_vault(enriched: list[dict], metrics_list: list, days: int) -> Path:
@@ -353,13 +445,27 @@ def _write_report_to_vault(enriched: list[dict], metrics_list: list, days: int)
     total_replies = 0
     total_retweets = 0
 
-    for entry in enriched:
+    # Top tweets by likes, kept in a bounded min-heap during the totals pass.
+    # The negated index breaks ties in favour of the earlier tweet.
+    top_heap: list[tuple[int, int]] = []
+
+    for i, entry in enumerate(enriched):
         m = entry.get("metrics", {})
+        likes = m.get("likes", 0)
         total_impressions += m.get("impressions", 0)
-        total_likes += m.get("likes", 0)
+        total_likes += likes
         total_replies += m.get("replies", 0)
         total_retweets += m.get("retweets", 0)
 
+        if len(top_heap) < TOP_TWEETS:
+            heapq.heappush(top_heap, (likes, -i))
+        elif (likes, -i) > top_heap[0]:
+            heapq.heapreplace(top_heap, (likes, -i))
+
+    top_tweets = [
+        enriched[-neg_i] for likes, neg_i in sorted(top_heap, reverse=True) if likes > 0
+    ]
+
     total_engagement = total_likes + total_replies + total_retweets
     eng_rate = (total_engagement / total_impressions * 100) if total_impressions > 0 else 0.0
 
@@ -414,22 +520,39 @@ def _write_report_to_vault(enriched: list[dict], metrics_list: list, days: int)
     ])
 
     # Top performing tweet
-    if enriched:
-        best = max(enriched, key=lambda e: e.get("metrics", {}).get("likes", 0))
+    if top_tweets:
+        best = top_tweets[0]
         best_m = best.get("metrics", {})
-        if best_m.get("likes", 0) > 0:
-            lines.extend([
-                "## Top Performing Tweet",
-                "",
-                f"> {best.get('content', 'N/A')}",
-                "",
-                f"- **Likes:** {best_m.get('likes', 0)}",
-                f"- **Impressions:** {best_m.get('impressions', 0):,}",
-                f"- **Engagement:** {best_m.get('engagement_rate', 0):.2f}%",
-                "",
-                "---",
-                "",
-            ])
+        lines.extend([
+            "## Top Performing Tweet",
+            "",
+            f"> {best.get('content', 'N/A')}",
+            "",
+            f"- **Likes:** {best_m.get('likes', 0)}",
+            f"- **Impressions:** {best_m.get('impressions', 0):,}",
+            f"- **Engagement:** {best_m.get('engagement_rate', 0):.2f}%",
+            "",
+            "---",
+            "",
+        ])
+
+    if len(top_tweets) > 1:
+        lines.extend([
+            f"## Top {len(top_tweets)} Tweets by Likes",
+            "",
+            "| # | Tweet | Likes | Impr. |",
+            "|---|---|---|---|",
+        ])
+        for rank, entry in enumerate(top_tweets, 1):
+            m = entry.get("metrics", {})
+            text = entry.get("content", "")
+            preview = text[:60].replace("|", "/")
+            if len(text) > 60:
+                preview += "..."
+            lines.append(
+                f"| {rank} | {preview} | {m.get('likes', 0)} | {m.get('impressions', 0):,} |"
+            )
+        lines.extend(["", "---", ""])
 
     # Recommendations
     lines.extend([
@@ -526,7 +649,7 @@ def main() -> None:
     if args.tweet:
         cmd_tweet(args.tweet, args.media)
     elif args.thread:
-        parts = [t.strip() for t in args.thread.split("|") if t.strip()]
+        parts = [t for t in map(str.strip, args.thread.split("|")) if t]
         if len(parts) < 2:
             print("Thread requires at least 2 tweets (pipe-separated).")
             sys.exit(1)
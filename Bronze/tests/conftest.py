@@ -0,0 +1,17 @@
+"""
+Gold Tier — pytest configuration
+==================================
+Makes the project importable when pytest collects from any directory.
+
+Parallel run (pytest-xdist; each test class stays on one worker):
+    python -m pytest tests/ -n auto --dist=loadscope
+"""
+
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+_PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(_PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(_PROJECT_ROOT))
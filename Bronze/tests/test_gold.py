@@ -6,21 +6,92 @@ Comprehensive tests for all Gold Tier modules.
 Run:
     python tests/test_gold.py
     python -m pytest tests/test_gold.py -v   (if pytest installed)
+    python -m pytest tests/ -n auto --dist=loadscope   (parallel, needs pytest-xdist)
 """
 
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
 import json
+import os
+import shutil
 import sys
+import tempfile
+import threading
 import unittest
-from datetime import datetime
+from datetime import datetime, timedelta
 from pathlib import Path
 
 _PROJECT_ROOT = Path(__file__).resolve().parent.parent
 if str(_PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(_PROJECT_ROOT))
 
+from briefings.data_collectors import email_digest, financial_summary, social_metrics, vault_stats
+from briefings import weekly_ceo
+from briefings.weekly_ceo import _build_executive_summary, _collect_all, _collect_all_cached, generate_briefing
+from core.config_loader import config
+from core.error_logger import ErrorLogger
+from core.event_bus import EventBus
+from core.validator import _check_core_modules, validate_all
+from integrations.odoo.jsonrpc_client import OdooConnectionError, OdooJsonRpcClient
+from integrations.social.automation import (
+    SOCIAL_LOG_DIR, SUMMARY_DIR, SocialAutomation, _get_platform,
+)
+from integrations.social.base import MetricsResult, PostResult, SocialPlatform
+from integrations.social.content_queue import ContentQueue, _parse_frontmatter, _write_frontmatter
+from integrations.social.facebook import FacebookPlatform
+from integrations.social.linkedin import LinkedInPlatform
+from integrations.social.scheduler import SocialScheduler
+from integrations.social.twitter import TwitterPlatform
+from scripts import snapshot_mcp_tools, twitter_automation
+import watcher
+
+# MCP servers are imported inside their tests: they need the optional ``mcp``
+# package, and a missing package should only fail those tests.
+
+# Tool manifest written by scripts/snapshot_mcp_tools.py
+_MCP_SNAPSHOT = Path(__file__).resolve().parent / "_mcp_tools.json"
+
+# Scratch directories are suffixed per xdist worker so parallel runs don't collide
+_WORKER_ID = os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+# One event loop for the whole module instead of a new one per asyncio.run()
+_LOOP = asyncio.new_event_loop()
+atexit.register(_LOOP.close)
+
+
+def _run(coro):
+    return _LOOP.run_until_complete(coro)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_tools(server) -> tuple:
+    """List an MCP server's tools once per process."""
+    return tuple(_run(server.list_tools()))
+
+
+# Briefing collectors return canned data so the tests exercise the wiring
+# rather than walking the vault and probing Odoo.  TestDataCollectors
+# clears this to run the real collectors.
+_FAKE_ENV = "HACKATHON_COLLECTOR_FAKE"
+_saved_fake_env = None
+
+
+def setUpModule():
+    global _saved_fake_env
+    _saved_fake_env = os.environ.get(_FAKE_ENV)
+    os.environ[_FAKE_ENV] = "1"
+
+
+def tearDownModule():
+    if _saved_fake_env is None:
+        os.environ.pop(_FAKE_ENV, None)
+    else:
+        os.environ[_FAKE_ENV] = _saved_fake_env
+
 
 # ===================================================================
 # 1. Core Infrastructure
@@ -30,7 +101,6 @@ class TestEventBus(unittest.TestCase):
     """Test core/event_bus.py"""
 
     def setUp(self):
-        from core.event_bus import EventBus
         self.bus = EventBus()
 
     def test_subscribe_and_emit(self):
@@ -54,6 +124,33 @@ class TestEventBus(unittest.TestCase):
         self.bus.emit("test.unsub", {})
         self.assertEqual(len(results), 0)
 
+    def test_unsubscribe_bound_method(self):
+        class Listener:
+            def __init__(self):
+                self.calls = 0
+
+            def handle(self, data):
+                self.calls += 1
+
+        listener = Listener()
+        self.bus.on("test.unsub", listener.handle)
+        # Each attribute access creates a new bound-method object
+        self.assertTrue(self.bus.off("test.unsub", listener.handle))
+        self.bus.emit("test.unsub", {})
+        self.assertEqual(listener.calls, 0)
+
+    def test_duplicate_subscription(self):
+        # Same rule for exact, trie (trailing wildcard) and glob patterns
+        for pattern, event in (("dup.event", "dup.event"), ("dup.*", "dup.event"), ("*.event", "dup.event")):
+            results = []
+            handler = results.append
+            self.bus.on(pattern, handler)
+            self.bus.on(pattern, results.append)  # equal bound method
+            self.bus.emit(event, {})
+            self.assertEqual(len(results), 1, pattern)
+            self.assertTrue(self.bus.off(pattern, results.append))
+            self.assertFalse(self.bus.off(pattern, handler))
+
     def test_handler_exception_caught(self):
         def bad_handler(d):
             raise ValueError("boom")
@@ -67,6 +164,12 @@ class TestEventBus(unittest.TestCase):
         self.bus.emit("b", {})
         self.assertEqual(len(self.bus.history), 2)
 
+    def test_history_bounded(self):
+        bus = EventBus(max_history=3)
+        for name in ("a", "b", "c", "d"):
+            bus.emit(name, {})
+        self.assertEqual([r.event for r in bus.history], ["b", "c", "d"])
+
     def test_handlers_for(self):
         handler = lambda d: None
         self.bus.on("test.lookup", handler)
@@ -83,10 +186,18 @@ class TestEventBus(unittest.TestCase):
 class TestErrorLogger(unittest.TestCase):
     """Test core/error_logger.py"""
 
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory(prefix=f"hackathon_{_WORKER_ID}_")
+        cls.class_dir = Path(cls._tmp.name)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
     def setUp(self):
-        from core.error_logger import ErrorLogger
-        self.log_dir = _PROJECT_ROOT / "logs" / "_test"
-        self.log_dir.mkdir(parents=True, exist_ok=True)
+        # One sub-folder per test; the ErrorLogger creates it
+        self.log_dir = self.class_dir / self._testMethodName
         self.logger = ErrorLogger(
             error_log=self.log_dir / "error.log",
             audit_log=self.log_dir / "audit.log",
@@ -96,9 +207,7 @@ class TestErrorLogger(unittest.TestCase):
         )
 
     def tearDown(self):
-        import shutil
-        if self.log_dir.exists():
-            shutil.rmtree(self.log_dir)
+        self.logger.close()
 
     def test_log_error(self):
         rec = self.logger.log_error("test", ValueError("fail"), {"ctx": 1})
@@ -106,6 +215,11 @@ class TestErrorLogger(unittest.TestCase):
         self.assertEqual(rec["severity"], "ERROR")
         self.assertTrue((self.log_dir / "error.log").is_file())
 
+    def test_log_error_unencodable_context(self):
+        # Wider than 64 bits: orjson rejects it, the stdlib encoder takes over
+        self.logger.log_error("test", "big", {"n": 2**70})
+        self.assertEqual(self.logger.recent_errors(1)[0]["context"]["n"], 2**70)
+
     def test_log_audit(self):
         rec = self.logger.log_audit("test.action", "success", {"x": 1})
         self.assertEqual(rec["action"], "test.action")
@@ -117,8 +231,42 @@ class TestErrorLogger(unittest.TestCase):
         errors = self.logger.recent_errors(5)
         self.assertEqual(len(errors), 2)
 
+    def test_recent_errors_large_log(self):
+        # Log is several times the tail window; only the end is read
+        self.logger.log_errors_bulk("src", [f"e{i}" for i in range(500)])
+        errors = self.logger.recent_errors(3)
+        self.assertEqual([e["error"] for e in errors], ["e497", "e498", "e499"])
+
+    def test_concurrent_writers(self):
+        def write(n):
+            for i in range(100):
+                self.logger.log_audit(f"worker.{n}", "success", {"i": i})
+        threads = [threading.Thread(target=write, args=(n,)) for n in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        self.logger.flush()
+        lines = (self.log_dir / "audit.log").read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 400)
+
+    def test_log_error_not_blocked_by_writes(self):
+        self.logger.log_error("src", "first")  # creates error.log
+        finished = threading.Event()
+        with self.logger._io_lock:  # the writer is mid-write
+            threading.Thread(
+                target=lambda: (self.logger.log_error("src", "second"), finished.set()),
+            ).start()
+            self.assertTrue(finished.wait(2))
+
+    def test_flush_after_writer_died(self):
+        self.logger.log_audit("before", "success")
+        self.logger._queue.put((None, None))  # stop the writer behind its back
+        self.logger._writer.join()
+        self.logger.log_audit("after", "success")
+        self.assertEqual([r["action"] for r in self.logger.recent_audit(5)], ["before", "after"])
+
     def test_alert_escalation(self):
-        from core.event_bus import EventBus
         bus = EventBus()
         self.logger.set_event_bus(bus)
         alerts = []
@@ -133,41 +281,66 @@ class TestErrorLogger(unittest.TestCase):
     def test_rotation(self):
         # Write enough to trigger size-based rotation
         self.logger._max_file_bytes = 100  # tiny threshold
-        for i in range(20):
-            self.logger.log_error("rot", f"error {i}")
+        self.logger.log_errors_bulk("rot", [f"error {i}" for i in range(20)])
         archived = self.logger.rotate_if_needed()
         self.assertGreater(len(archived), 0)
+        # A fresh, empty log replaces the archived one straight away
+        self.assertEqual((self.log_dir / "error.log").stat().st_size, 0)
+
+    def test_rotation_during_writes(self):
+        self.logger.log_error("busy", "before rotation")
+        real_move = shutil.move
+
+        def move_during_write(src, dst):
+            # Another thread logs while the rotation is under way
+            writer = threading.Thread(target=lambda: (
+                self.logger.log_error("busy", "during rotation"), self.logger.flush(),
+            ))
+            writer.start()
+            writer.join(0.5)
+            return real_move(src, dst)
+
+        shutil.move = move_during_write
+        try:
+            self.logger.force_rotate()
+        finally:
+            shutil.move = real_move
+        self.logger.log_error("busy", "after rotation")
+        errors = [e["error"] for e in self.logger.recent_errors(5)]
+        self.assertEqual(errors, ["during rotation", "after rotation"])
+
+    def test_log_errors_bulk(self):
+        records = self.logger.log_errors_bulk("bulk", ["e1", ValueError("e2")])
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[1]["error_type"], "ValueError")
+        self.assertEqual(len(self.logger.recent_errors(5)), 2)
+        self.assertEqual(self.logger.error_count_since("bulk"), 2)
 
 
 class TestConfigLoader(unittest.TestCase):
     """Test core/config_loader.py"""
 
     def test_load(self):
-        from core.config_loader import config
         config.load()
         self.assertIsNotNone(config.scheduler)
         self.assertIsInstance(config.scheduler, dict)
 
     def test_get_dotted(self):
-        from core.config_loader import config
         config.load()
         val = config.get("scheduler.vault_scan_interval_min")
         self.assertEqual(val, 5)
 
     def test_get_default(self):
-        from core.config_loader import config
         config.load()
         val = config.get("nonexistent.key", default="fallback")
         self.assertEqual(val, "fallback")
 
     def test_section(self):
-        from core.config_loader import config
         config.load()
         s = config.section("error_logging")
         self.assertIn("alert_threshold", s)
 
     def test_properties(self):
-        from core.config_loader import config
         config.load()
         self.assertIsInstance(config.social_accounts, dict)
         self.assertIsInstance(config.odoo, dict)
@@ -182,47 +355,51 @@ class TestSocialBase(unittest.TestCase):
     """Test integrations/social/base.py"""
 
     def test_post_result_dataclass(self):
-        from integrations.social.base import PostResult
         r = PostResult(success=True, platform="test", post_id="123")
         self.assertTrue(r.success)
         self.assertEqual(r.platform, "test")
         self.assertIsNotNone(r.timestamp)
 
     def test_metrics_result(self):
-        from integrations.social.base import MetricsResult
         m = MetricsResult(platform="twitter", post_id="456", impressions=1000, likes=50)
         self.assertEqual(m.engagement_rate, 5.0)  # 50/1000*100
 
     def test_validate_content_empty(self):
-        from integrations.social.linkedin import LinkedInPlatform
         li = LinkedInPlatform()
         self.assertIsNotNone(li.validate_content(""))
 
     def test_validate_content_ok(self):
-        from integrations.social.twitter import TwitterPlatform
         tw = TwitterPlatform()
         self.assertIsNone(tw.validate_content("Hello world"))
 
     def test_validate_content_too_long(self):
-        from integrations.social.twitter import TwitterPlatform
         tw = TwitterPlatform()
         self.assertIsNotNone(tw.validate_content("x" * 281))
 
+    def test_validate_content_url_weight(self):
+        tw = TwitterPlatform()
+        # Links count as 23 characters regardless of their real length
+        self.assertIsNone(tw.validate_content("x" * 250 + " https://example.com/" + "p" * 100))
+        self.assertIsNotNone(tw.validate_content("x" * 270 + " http://a.co"))
+
 
 class TestContentQueue(unittest.TestCase):
     """Test integrations/social/content_queue.py"""
 
-    def setUp(self):
-        self.test_dir = _PROJECT_ROOT / "tests" / "_test_queue"
-        self.test_dir.mkdir(parents=True, exist_ok=True)
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory(prefix=f"hackathon_queue_{_WORKER_ID}_")
+        cls.class_dir = Path(cls._tmp.name)
 
-    def tearDown(self):
-        import shutil
-        if self.test_dir.exists():
-            shutil.rmtree(self.test_dir)
+    @classmethod
+    def tearDownClass(cls):
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        self.test_dir = self.class_dir / self._testMethodName
+        self.test_dir.mkdir(exist_ok=True)
 
     def test_parse_frontmatter(self):
-        from integrations.social.content_queue import _parse_frontmatter
         content = "---\nplatforms: linkedin, twitter\nstatus: draft\n---\nHello world"
         meta, body = _parse_frontmatter(content)
         self.assertEqual(meta["platforms"], ["linkedin", "twitter"])
@@ -230,14 +407,12 @@ class TestContentQueue(unittest.TestCase):
         self.assertEqual(body, "Hello world")
 
     def test_write_frontmatter(self):
-        from integrations.social.content_queue import _write_frontmatter
         result = _write_frontmatter({"status": "draft", "platforms": ["linkedin"]}, "Content")
         self.assertIn("---", result)
         self.assertIn("status: draft", result)
         self.assertIn("Content", result)
 
     def test_queue_lifecycle(self):
-        from integrations.social.content_queue import ContentQueue, _write_frontmatter
 
         # Write a test draft
         draft = self.test_dir / "social_test.md"
@@ -252,17 +427,29 @@ class TestContentQueue(unittest.TestCase):
         self.assertEqual(items[0].status, "approved")
         self.assertTrue(items[0].is_ready)
 
+    def test_crlf_draft(self):
+        # Small drafts are parsed from the head, large ones read lazily;
+        # both must translate Windows line endings like read_text() does
+        for name, body in (("small", "Line one\r\nLine two"), ("large", "x" * 4096 + "\r\nend")):
+            draft = self.test_dir / f"social_{name}.md"
+            draft.write_bytes(
+                f"---\r\nstatus: approved\r\n---\r\n{body}".encode("utf-8")
+            )
+        items = {item.path.stem: item for item in ContentQueue(queue_dir=self.test_dir).scan()}
+        for item in items.values():
+            self.assertEqual(item.status, "approved")
+            self.assertNotIn("\r", item.body)
+        self.assertEqual(items["social_small"].body, "Line one\nLine two")
+
 
 class TestSocialScheduler(unittest.TestCase):
     """Test integrations/social/scheduler.py"""
 
     def test_can_post(self):
-        from integrations.social.scheduler import SocialScheduler
         sched = SocialScheduler()
         self.assertTrue(sched.can_post("linkedin"))
 
     def test_next_optimal_slot(self):
-        from integrations.social.scheduler import SocialScheduler
         sched = SocialScheduler()
         slot = sched.next_optimal_slot("twitter")
         self.assertIsNotNone(slot)
@@ -274,29 +461,44 @@ class TestSocialScheduler(unittest.TestCase):
 # ===================================================================
 
 class TestDataCollectors(unittest.TestCase):
-    """Test briefings/data_collectors/*"""
+    """Test briefings/data_collectors/* (real collectors, not the fakes)"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls._saved_fake = os.environ.pop(_FAKE_ENV, None)
+
+    @classmethod
+    def tearDownClass(cls):
+        if cls._saved_fake is not None:
+            os.environ[_FAKE_ENV] = cls._saved_fake
+
+    def test_fake_switch(self):
+        os.environ[_FAKE_ENV] = "1"
+        try:
+            for collector in (vault_stats, financial_summary, social_metrics, email_digest):
+                data = collector.collect()
+                self.assertEqual(data, collector._FAKE_DATA)
+                self.assertIsNot(data, collector._FAKE_DATA)
+        finally:
+            del os.environ[_FAKE_ENV]
 
     def test_vault_stats(self):
-        from briefings.data_collectors.vault_stats import collect
-        data = collect()
+        data = vault_stats.collect()
         self.assertIn("inbox_count", data)
         self.assertIn("backlog", data)
         self.assertIn("high_priority_items", data)
 
     def test_financial_summary(self):
-        from briefings.data_collectors.financial_summary import collect
-        data = collect()
+        data = financial_summary.collect()
         self.assertIn("available", data)  # False when Odoo not connected
 
     def test_social_metrics(self):
-        from briefings.data_collectors.social_metrics import collect
-        data = collect()
+        data = social_metrics.collect()
         self.assertIn("platforms", data)
         self.assertIn("total_posts", data)
 
     def test_email_digest(self):
-        from briefings.data_collectors.email_digest import collect
-        data = collect()
+        data = email_digest.collect()
         self.assertIn("emails_received", data)
         self.assertIn("emails_sent", data)
         self.assertIn("key_threads", data)
@@ -310,21 +512,44 @@ class TestWeeklyBriefing(unittest.TestCase):
     """Test briefings/weekly_ceo.py"""
 
     def test_generate_stdout(self):
-        from briefings.weekly_ceo import generate_briefing
         # stdout_only=True should return None and not write a file
         result = generate_briefing(stdout_only=True)
         self.assertIsNone(result)
 
     def test_collect_all(self):
-        from briefings.weekly_ceo import _collect_all
         data = _collect_all()
         self.assertIn("vault", data)
         self.assertIn("financials", data)
         self.assertIn("social", data)
         self.assertIn("email", data)
 
+    def test_collect_all_cached(self):
+        # Same key twice: other tests (or xdist workers) may touch the vault
+        # between two _collect_all() calls, so drive the cache directly
+        key = weekly_ceo._compute_key()
+        first = _collect_all_cached(key)
+        hits = _collect_all_cached.cache_info().hits
+        self.assertIs(_collect_all_cached(key), first)
+        self.assertEqual(_collect_all_cached.cache_info().hits, hits + 1)
+        self.assertNotIn("financials", first)  # live Odoo data is never cached
+
+    def test_cache_key_tracks_file_edits(self):
+        with tempfile.TemporaryDirectory(prefix=f"hackathon_{_WORKER_ID}_") as tmp:
+            note = Path(tmp) / "task.md"
+            note.write_text("- **High** priority", encoding="utf-8")
+            original = weekly_ceo._STAGE_DIRS
+            weekly_ceo._STAGE_DIRS = (Path(tmp),)
+            try:
+                before = weekly_ceo._compute_key()
+                st = note.stat()
+                # Edited in place: the directory mtime doesn't change
+                os.utime(note, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+                after = weekly_ceo._compute_key()
+            finally:
+                weekly_ceo._STAGE_DIRS = original
+        self.assertNotEqual(before, after)
+
     def test_executive_summary(self):
-        from briefings.weekly_ceo import _build_executive_summary
         data = {
             "vault": {"done_this_week": 10, "new_this_week": 5, "backlog": 3},
             "financials": {"available": False},
@@ -343,12 +568,9 @@ class TestWeeklyBriefing(unittest.TestCase):
 class TestMCPServers(unittest.TestCase):
     """Test that all MCP servers register their tools correctly."""
 
-    def _get_tools(self, server):
-        return asyncio.run(server.list_tools())
-
     def test_vault_server(self):
         from mcp_servers.vault_server import mcp
-        tools = self._get_tools(mcp)
+        tools = _get_tools(mcp)
         names = [t.name for t in tools]
         self.assertIn("vault_status", names)
         self.assertIn("list_tasks", names)
@@ -356,14 +578,14 @@ class TestMCPServers(unittest.TestCase):
 
     def test_email_server(self):
         from mcp_servers.email_server import mcp
-        tools = self._get_tools(mcp)
+        tools = _get_tools(mcp)
         names = [t.name for t in tools]
         self.assertIn("send_email", names)
         self.assertIn("check_inbox", names)
 
     def test_accounting_server(self):
         from mcp_servers.accounting_server import mcp
-        tools = self._get_tools(mcp)
+        tools = _get_tools(mcp)
         names = [t.name for t in tools]
         self.assertIn("get_unpaid_invoices", names)
         self.assertIn("get_profit_loss", names)
@@ -371,7 +593,7 @@ class TestMCPServers(unittest.TestCase):
 
     def test_social_server(self):
         from mcp_servers.social_server import mcp
-        tools = self._get_tools(mcp)
+        tools = _get_tools(mcp)
         names = [t.name for t in tools]
         self.assertIn("create_draft", names)
         self.assertIn("post_now", names)
@@ -383,25 +605,33 @@ class TestMCPServers(unittest.TestCase):
 
     def test_briefing_server(self):
         from mcp_servers.briefing_server import mcp
-        tools = self._get_tools(mcp)
+        tools = _get_tools(mcp)
         names = [t.name for t in tools]
         self.assertIn("generate_weekly_briefing", names)
         self.assertIn("get_last_briefing", names)
 
     def test_total_tool_count(self):
-        """Verify we have 30 total tools across all servers."""
-        from mcp_servers.vault_server import mcp as v
-        from mcp_servers.email_server import mcp as e
-        from mcp_servers.accounting_server import mcp as a
-        from mcp_servers.social_server import mcp as s
-        from mcp_servers.briefing_server import mcp as b
-
-        total = sum(
-            len(self._get_tools(server))
-            for server in (v, e, a, s, b)
-        )
+        """Verify we have 30 total tools across all servers (from the snapshot)."""
+        snapshot = json.loads(_MCP_SNAPSHOT.read_text(encoding="utf-8"))
+        for server, digest in snapshot["sources"].items():
+            self.assertEqual(
+                digest, snapshot_mcp_tools.source_hash(server),
+                f"{server}.py changed — run: python scripts/snapshot_mcp_tools.py",
+            )
+        total = sum(len(tools) for tools in snapshot["servers"].values())
         self.assertEqual(total, 30)
 
+    @unittest.skipUnless(os.environ.get("HACKATHON_LIVE_MCP"), "set HACKATHON_LIVE_MCP=1 to list live tools")
+    def test_snapshot_matches_live_tools(self):
+        """Slow: import every server and compare list_tools() with the snapshot."""
+        import importlib
+
+        snapshot = json.loads(_MCP_SNAPSHOT.read_text(encoding="utf-8"))
+        for server, names in snapshot["servers"].items():
+            module = importlib.import_module(f"mcp_servers.{server}")
+            live = [t.name for t in _get_tools(module.mcp)]
+            self.assertEqual(sorted(live), sorted(names), server)
+
 
 # ===================================================================
 # 5b. Facebook Platform & Social Automation
@@ -411,24 +641,19 @@ class TestFacebookPlatform(unittest.TestCase):
     """Test integrations/social/facebook.py"""
 
     def test_import(self):
-        from integrations.social.facebook import FacebookPlatform
         self.assertTrue(callable(FacebookPlatform))
 
     def test_implements_base(self):
-        from integrations.social.facebook import FacebookPlatform
-        from integrations.social.base import SocialPlatform
         fb = FacebookPlatform()
         self.assertIsInstance(fb, SocialPlatform)
         self.assertEqual(fb.platform_name, "facebook")
         self.assertEqual(fb.char_limit, 63206)
 
     def test_validate_content_empty(self):
-        from integrations.social.facebook import FacebookPlatform
         fb = FacebookPlatform()
         self.assertIsNotNone(fb.validate_content(""))
 
     def test_validate_content_ok(self):
-        from integrations.social.facebook import FacebookPlatform
         fb = FacebookPlatform()
         self.assertIsNone(fb.validate_content("Hello from Facebook!"))
 
@@ -437,18 +662,15 @@ class TestSocialAutomation(unittest.TestCase):
     """Test integrations/social/automation.py"""
 
     def test_import(self):
-        from integrations.social.automation import SocialAutomation
         self.assertTrue(callable(SocialAutomation))
 
     def test_init(self):
-        from integrations.social.automation import SocialAutomation
         auto = SocialAutomation()
         self.assertIsNotNone(auto.scheduler)
         self.assertIsNotNone(auto.queue)
         self.assertIsInstance(auto._history, list)
 
     def test_engagement_summary_empty(self):
-        from integrations.social.automation import SocialAutomation
         auto = SocialAutomation()
         summary = auto.generate_engagement_summary(days=1)
         self.assertIn("total_posts", summary)
@@ -458,13 +680,11 @@ class TestSocialAutomation(unittest.TestCase):
         self.assertIn("instagram", summary["rate_limits"])
 
     def test_vault_log_directories(self):
-        from integrations.social.automation import SOCIAL_LOG_DIR, SUMMARY_DIR
         # Directories should be under vault/Done/
         self.assertIn("Done", str(SOCIAL_LOG_DIR))
         self.assertIn("Done", str(SUMMARY_DIR))
 
     def test_get_platform_helper(self):
-        from integrations.social.automation import _get_platform
         fb = _get_platform("facebook")
         self.assertIsNotNone(fb)
         self.assertEqual(fb.platform_name, "facebook")
@@ -472,6 +692,84 @@ class TestSocialAutomation(unittest.TestCase):
         self.assertIsNotNone(ig)
         self.assertEqual(ig.platform_name, "instagram")
         self.assertIsNone(_get_platform("nonexistent"))
+        self.assertIs(_get_platform("Facebook"), fb)
+
+
+class TestTwitterHistory(unittest.TestCase):
+    """Test scripts/twitter_automation.py post history"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory(prefix=f"hackathon_{_WORKER_ID}_")
+        self.addCleanup(tmp.cleanup)
+        self.history_file = Path(tmp.name) / "history.jsonl"
+        self.legacy_file = Path(tmp.name) / "history.json"
+        for name, value in (("HISTORY_FILE", self.history_file),
+                            ("_LEGACY_HISTORY_FILE", self.legacy_file)):
+            self.addCleanup(setattr, twitter_automation, name, getattr(twitter_automation, name))
+            setattr(twitter_automation, name, value)
+
+    @staticmethod
+    def _entry(tweet_id, days_ago):
+        ts = (datetime.now() - timedelta(days=days_ago)).isoformat()
+        return twitter_automation._history_entry(tweet_id, "text", True, timestamp=ts)
+
+    def _stored_ids(self):
+        lines = self.history_file.read_text(encoding="utf-8").splitlines()
+        return [json.loads(line)["tweet_id"] for line in lines]
+
+    def test_legacy_history_migrated(self):
+        self.legacy_file.write_text(json.dumps([self._entry("1", 1)]), encoding="utf-8")
+        twitter_automation._append_history([self._entry("2", 0)])
+
+        history = twitter_automation._compact_history()
+        self.assertEqual([h["tweet_id"] for h in history], ["1", "2"])
+        self.assertEqual(self._stored_ids(), ["1", "2"])
+        self.assertFalse(self.legacy_file.exists())
+
+    def test_expired_entries_dropped(self):
+        days = twitter_automation.HISTORY_RETENTION_DAYS
+        twitter_automation._append_history([self._entry("old", days + 1), self._entry("new", 1)])
+
+        self.assertEqual([h["tweet_id"] for h in twitter_automation._load_history()], ["new"])
+        self.assertEqual([h["tweet_id"] for h in twitter_automation._compact_history()], ["new"])
+        self.assertEqual(self._stored_ids(), ["new"])
+
+    def test_concurrent_append_kept(self):
+        days = twitter_automation.HISTORY_RETENTION_DAYS
+        twitter_automation._append_history([self._entry("old", days + 1), self._entry("new", 1)])
+        read_history = twitter_automation._read_history
+
+        def read_then_append():
+            history = read_history()
+            # Another CLI run appends while this one compacts
+            twitter_automation._append_history([self._entry("late", 0)])
+            return history
+
+        twitter_automation._read_history = read_then_append
+        try:
+            twitter_automation._compact_history()
+        finally:
+            twitter_automation._read_history = read_history
+        self.assertEqual(self._stored_ids(), ["new", "late"])
+
+    def test_report_top_tweets_ellipsis(self):
+        report_dir = self.history_file.parent / "reports"
+        self.addCleanup(setattr, twitter_automation, "TWITTER_REPORT_DIR", twitter_automation.TWITTER_REPORT_DIR)
+        twitter_automation.TWITTER_REPORT_DIR = report_dir
+        short, long = "Short tweet", "L" * 80
+        enriched = [
+            {"content": short, "timestamp": "2026-01-01T00:00:00", "metrics": {"likes": 5}},
+            {"content": long, "timestamp": "2026-01-02T00:00:00", "metrics": {"likes": 3}},
+        ]
+        text = twitter_automation._write_report_to_vault(enriched, [], 7).read_text(encoding="utf-8")
+        self.assertIn(f"| 1 | {short} | 5 |", text)
+        self.assertIn(f"| 2 | {'L' * 60}... | 3 |", text)
+
+    def test_unchanged_history_not_rewritten(self):
+        twitter_automation._append_history([self._entry("1", 1)])
+        mtime = self.history_file.stat().st_mtime_ns
+        twitter_automation._compact_history()
+        self.assertEqual(self.history_file.stat().st_mtime_ns, mtime)
 
 
 # ===================================================================
@@ -482,19 +780,16 @@ class TestOdooJsonRpcClient(unittest.TestCase):
     """Test integrations/odoo/jsonrpc_client.py"""
 
     def test_import(self):
-        from integrations.odoo.jsonrpc_client import OdooJsonRpcClient, OdooConnectionError
         self.assertTrue(callable(OdooJsonRpcClient))
         self.assertTrue(issubclass(OdooConnectionError, Exception))
 
     def test_client_init(self):
-        from integrations.odoo.jsonrpc_client import OdooJsonRpcClient
         client = OdooJsonRpcClient()
         self.assertIsNotNone(client.url)
         self.assertIsNotNone(client.db)
         self.assertIsNone(client._uid)
 
     def test_requires_url_and_db(self):
-        from integrations.odoo.jsonrpc_client import OdooJsonRpcClient, OdooConnectionError
         client = OdooJsonRpcClient()
         original_url = client.url
         client.url = ""
@@ -506,12 +801,9 @@ class TestOdooJsonRpcClient(unittest.TestCase):
 class TestOdooJsonRpcServer(unittest.TestCase):
     """Test mcp_servers/odoo_jsonrpc_server.py"""
 
-    def _get_tools(self, server):
-        return asyncio.run(server.list_tools())
-
     def test_server_registers_tools(self):
         from mcp_servers.odoo_jsonrpc_server import mcp
-        tools = self._get_tools(mcp)
+        tools = _get_tools(mcp)
         names = [t.name for t in tools]
         self.assertIn("create_invoice", names)
         self.assertIn("get_invoice", names)
@@ -526,11 +818,10 @@ class TestOdooJsonRpcServer(unittest.TestCase):
 
     def test_tool_count(self):
         from mcp_servers.odoo_jsonrpc_server import mcp
-        tools = self._get_tools(mcp)
+        tools = _get_tools(mcp)
         self.assertEqual(len(tools), 10)
 
     def test_vault_log_helper(self):
-        import shutil
         from mcp_servers.odoo_jsonrpc_server import _vault_log, LOG_DIR
         test_path = _vault_log("Test_Entry", "Hello world\n\n#test\n")
         self.assertTrue(test_path.exists())
@@ -555,6 +846,86 @@ class TestOdooJsonRpcServer(unittest.TestCase):
         path.unlink(missing_ok=True)
 
 
+# ===================================================================
+# 5d. Inbox Watcher
+# ===================================================================
+
+class TestInboxWatcher(unittest.TestCase):
+    """Test watcher.py processed-file manifest"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory(prefix=f"hackathon_{_WORKER_ID}_")
+        self.addCleanup(tmp.cleanup)
+        root = Path(tmp.name)
+        self.inbox = root / "Inbox"
+        self.needs_action = root / "Needs_Action"
+        for folder in (self.inbox, self.needs_action, root / "Done"):
+            folder.mkdir()
+        self.db_path = str(root / ".processed.db")
+        self._patch("NEEDS_ACTION_DIR", str(self.needs_action))
+        self._patch("DONE_DIR", str(root / "Done"))
+        # The triage memo stores destination paths
+        watcher._triage_cache.clear()
+        self.addCleanup(watcher._triage_cache.clear)
+        self._new_manifest()
+
+    def _patch(self, name, value):
+        original = getattr(watcher, name)
+        setattr(watcher, name, value)
+        self.addCleanup(setattr, watcher, name, original)
+
+    def _new_manifest(self):
+        """Fresh manifest on the same database, as after a restart."""
+        manifest = watcher.ProcessedManifest(self.db_path)
+        self.addCleanup(manifest.close)
+        self._patch("manifest", manifest)
+        return manifest
+
+    def _note(self, name, text):
+        path = self.inbox / name
+        path.write_text(text, encoding="utf-8")
+        return str(path)
+
+    def test_unchanged_note_skipped_on_restart(self):
+        note = self._note("task.md", "Please review the draft")
+        watcher.process_file(note)
+        output = self.needs_action / "task.md"
+        self.assertTrue(output.is_file())
+
+        output.unlink()  # output moved on; the note itself is unchanged
+        self._new_manifest()
+        watcher.process_file(note)
+        self.assertFalse(output.exists())
+
+    def test_changed_note_retriaged(self):
+        note = self._note("task.md", "Please review the draft")
+        watcher.process_file(note)
+        output = self.needs_action / "task.md"
+        output.unlink()
+
+        st = os.stat(note)
+        os.utime(note, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        watcher.process_file(note)
+        self.assertTrue(output.is_file())
+
+    def test_existing_output_marks_note(self):
+        note = self._note("task.md", "Please review the draft")
+        (self.needs_action / "task.md").write_text("already there", encoding="utf-8")
+        watcher.process_file(note)
+        self.assertTrue(watcher.manifest.is_processed(note, os.stat(note)))
+
+    def test_manifest_holds_no_write_lock(self):
+        # Two processes (watcher + recovery manager) share the database
+        first = watcher.manifest
+        second = self._new_manifest()
+        a = self._note("a.md", "a")
+        b = self._note("b.md", "b")
+        first.mark(a, os.stat(a))
+        second.mark(b, os.stat(b))
+        self.assertTrue(first.is_processed(b, os.stat(b)))
+        self.assertTrue(second.is_processed(a, os.stat(a)))
+
+
 # ===================================================================
 # 6. Validator
 # ===================================================================
@@ -563,7 +934,6 @@ class TestValidator(unittest.TestCase):
     """Test core/validator.py"""
 
     def test_validate_all(self):
-        from core.validator import validate_all
         results = validate_all()
         self.assertIn("Directories", results)
         self.assertIn("Config Files", results)
@@ -571,7 +941,6 @@ class TestValidator(unittest.TestCase):
         self.assertIn("MCP Configuration", results)
 
     def test_all_modules_import(self):
-        from core.validator import _check_core_modules
         checks = _check_core_modules()
         failed = [c for c in checks if not c.ok]
         self.assertEqual(len(failed), 0, f"Failed imports: {failed}")
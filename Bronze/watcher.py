@@ -7,13 +7,17 @@ All errors are logged via the centralized error logger and failed tasks
 are queued for automatic retry by the recovery manager.
 """
 
+import hashlib
+import queue
 import re
+import sqlite3
+import threading
 import time
 import os
 import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -30,59 +34,190 @@ from core.retry import retry, failed_queue
 # Configuration
 # ---------------------------------------------------------------------------
 VAULT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "vault")
+NEEDS_ACTION_NAME = "Needs_Action"
+DONE_NAME = "Done"
 INBOX_DIR = os.path.join(VAULT_DIR, "Inbox")
-NEEDS_ACTION_DIR = os.path.join(VAULT_DIR, "Needs_Action")
-DONE_DIR = os.path.join(VAULT_DIR, "Done")
+NEEDS_ACTION_DIR = os.path.join(VAULT_DIR, NEEDS_ACTION_NAME)
+DONE_DIR = os.path.join(VAULT_DIR, DONE_NAME)
+
+# Triage is I/O bound (read, write, audit log), so threads scale well
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# Observer backend: "native" (inotify / FSEvents / ReadDirectoryChangesW) or
+# "polling" for network shares where native change events are unreliable
+WATCHER_BACKEND = os.environ.get("WATCHER_BACKEND", "native").lower()
+
+# Inbox files already triaged, keyed by path with their mtime and size, so
+# a restart doesn't re-read and re-triage notes whose output was moved on.
+# Runtime state, so it lives in Logs/ (with the failed-task queue), not the vault.
+MANIFEST_PATH = os.path.join(_PROJECT_ROOT, "Logs", "processed_inbox.db")
+MANIFEST_TIMEOUT = 2.0  # seconds to wait on another process's write lock
+
+# Quiet time after a file's last event before it is processed, so the
+# writer has finished with it
+SETTLE_SECONDS = 0.5
 
 ACTION_VERBS = [
     "fix", "add", "remove", "update", "create",
     "delete", "change", "implement", "deploy", "review",
 ]
 
+# Triage patterns, compiled once.  The action verbs are fused into a single
+# alternation so rule 3 is one scan instead of one search per verb.  Both
+# run on the lowercased body, and only after a plain substring check (much
+# faster than a regex scan) finds a candidate word.  Checklist markers
+# (rules 4 and 5) are fixed strings and need no regex at all.  Matching
+# word tokens against a set of verbs was measured too: re.findall(r"\w+")
+# is slower than the fused scan, and str.split() keeps punctuation on
+# words ("fix," is not "fix"), so it can't replace the \b match.
+_DONE_RE = re.compile(r"\b(?:done|completed)\b")
+_VERBS_RE = re.compile(r"\b(?:" + "|".join(map(re.escape, ACTION_VERBS)) + r")\b")
+
+# Titles and summaries look at the head of a note first and only scan the
+# rest when the head has no heading / too few body lines
+TITLE_HEAD_CHARS = 1024
+SUMMARY_HEAD_CHARS = 16 * 1024
+
+# Summary patterns.  A TL;DR / Summary: line is found with one search over
+# the whole note; _LINE_BREAKS are the separators str.splitlines() uses.
+# The markdown strippers run over all body lines at once (joined with "\n");
+# none of them can match across a newline, so the result is the same as
+# stripping line by line.
+_LINE_BREAKS = "\n\r\v\f\x1c\x1d\x1e\x85\u2028\u2029"
+_TLDR_RE = re.compile(
+    rf"(?:^|(?<=[{_LINE_BREAKS}]))[^\S{_LINE_BREAKS}]*((?:(?i:TL;DR)|Summary:)[^{_LINE_BREAKS}]*)"
+)
+_HEADING_RE = re.compile(r"^#+[^\S\n]*", re.MULTILINE)
+_BOLD_RE = re.compile(r"\*\*(.+?)\*\*")
+_ITALIC_RE = re.compile(r"\*(.+?)\*")
+_IMAGE_RE = re.compile(r"!\[.*?\]\(.*?\)")
+_LINK_RE = re.compile(r"\[(.+?)\]\(.*?\)")
+
+# Exclusive create for output files.  Output is written as pre-encoded
+# bytes, so O_BINARY (Windows) stops the C runtime translating newlines;
+# the platform line ending is applied before encoding.
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0)
+
+# Notes at least this big are copied into the output in-kernel with
+# os.copy_file_range (Linux) when their bytes can go out unchanged; smaller
+# ones are cheaper as a single writev of the bytes already in memory
+COPY_RANGE_MIN_BYTES = 64 * 1024
+
+# Output file layout from SKILL.md (Step 4), split around the original
+# note so it can be written without copying it into one big string
+OUTPUT_HEADER = """# {title}
+
+## Metadata
+- **Source:** Inbox/{filename}
+- **Received:** {timestamp}
+- **Routed to:** {dest_folder_name}/
+- **Triage rule:** {rule_label}
+- **Status:** {status}
+
+## Summary
+{summary}
+
+## Original Task
+"""
+OUTPUT_FOOTER = """
+
+## Agent Notes
+- Triage complete. File routed by rule {rule_label}.
+"""
+
+# Destination folder and status for each triage rule (0 = empty file), as
+# decided by decide_destination.  These fix the routing lines of the output,
+# so each rule gets its own header with them already filled in and a
+# finished footer; only title, filename, timestamp and summary vary.
+_RULE_OUTCOMES = {
+    0: (NEEDS_ACTION_NAME, "Needs Action"),
+    1: (DONE_NAME, "Done"),
+    2: (NEEDS_ACTION_NAME, "Needs Action"),
+    3: (NEEDS_ACTION_NAME, "Needs Action"),
+    4: (NEEDS_ACTION_NAME, "Needs Action"),
+    5: (DONE_NAME, "Done"),
+    6: (NEEDS_ACTION_NAME, "Needs Action"),
+}
+
+
+def _rule_templates() -> dict[int, tuple[str, str]]:
+    templates = {}
+    for rule_num, (dest_folder_name, status) in _RULE_OUTCOMES.items():
+        fixed = {
+            "dest_folder_name": dest_folder_name,
+            "rule_label": f"#{rule_num}" if rule_num > 0 else "#0 (empty file)",
+            "status": status,
+        }
+        header = OUTPUT_HEADER
+        for key, value in fixed.items():
+            header = header.replace("{" + key + "}", value)
+        templates[rule_num] = (header, OUTPUT_FOOTER.format_map(fixed))
+    return templates
+
+
+_RULE_TEMPLATES = _rule_templates()  # rule number -> (header template, footer)
+
 
 # ---------------------------------------------------------------------------
 # Helper — extract a title from the file (first heading or filename)
 # ---------------------------------------------------------------------------
 def extract_title(content: str, filename: str) -> str:
     """Pull the first markdown heading, or fall back to the filename."""
-    for line in content.splitlines():
+    if len(content) <= TITLE_HEAD_CHARS:
+        title = _first_heading(content.splitlines())
+    else:
+        # The last line of the head may be cut off, so leave it out and scan
+        # the whole note only if the complete lines hold no heading
+        title = _first_heading(content[:TITLE_HEAD_CHARS].splitlines()[:-1])
+        if title is None:
+            title = _first_heading(content.splitlines())
+    return title if title is not None else _title_from_filename(filename)
+
+
+def _first_heading(lines: list[str]) -> str | None:
+    for line in lines:
         stripped = line.strip()
         if stripped.startswith("#"):
             return stripped.lstrip("#").strip()
+    return None
+
+
+def _title_from_filename(filename: str) -> str:
+    """Fallback title: the file stem with _ and - turned into spaces."""
     return os.path.splitext(filename)[0].replace("_", " ").replace("-", " ")
 
 
 # ---------------------------------------------------------------------------
 # Helper — build a short summary from the task body (Step 2)
 # ---------------------------------------------------------------------------
+def _body_lines(lines: list[str]) -> list[str]:
+    """Strip markdown formatting (headings, bold, italics, images, links) and blank lines."""
+    text = "\n".join(stripped for stripped in map(str.strip, lines) if stripped)
+    text = _HEADING_RE.sub("", text)
+    text = _BOLD_RE.sub(r"\1", text)
+    text = _ITALIC_RE.sub(r"\1", text)
+    text = _IMAGE_RE.sub("", text)
+    text = _LINK_RE.sub(r"\1", text)
+    return [plain for plain in map(str.strip, text.split("\n")) if plain]
+
+
 def summarize(content: str, max_lines: int = 5, max_chars: int = 300) -> str:
     """Return a plain-text summary following the SKILL.md rules."""
-    lines = content.splitlines()
-
     # Check for a TL;DR or Summary: line first
-    for line in lines:
-        stripped = line.strip()
-        if stripped.upper().startswith("TL;DR") or stripped.startswith("Summary:"):
-            summary = stripped
-            if len(summary) > max_chars:
-                summary = summary[: max_chars - 3] + "..."
-            return summary
-
-    # Strip markdown formatting and blank lines
-    body_lines = []
-    for line in lines:
-        stripped = line.strip()
-        if not stripped:
-            continue
-        # Remove headings, bold, links, images
-        plain = re.sub(r"^#+\s*", "", stripped)
-        plain = re.sub(r"\*\*(.+?)\*\*", r"\1", plain)
-        plain = re.sub(r"\*(.+?)\*", r"\1", plain)
-        plain = re.sub(r"!\[.*?\]\(.*?\)", "", plain)
-        plain = re.sub(r"\[(.+?)\]\(.*?\)", r"\1", plain)
-        plain = plain.strip()
-        if plain:
-            body_lines.append(plain)
+    match = _TLDR_RE.search(content)
+    if match:
+        summary = match.group(1).strip()
+        if len(summary) > max_chars:
+            summary = summary[: max_chars - 3] + "..."
+        return summary
+
+    if len(content) > SUMMARY_HEAD_CHARS:
+        # Drop the last line of the head: it may be cut mid-line
+        body_lines = _body_lines(content[:SUMMARY_HEAD_CHARS].splitlines()[:-1])
+        if len(body_lines) < max_lines:
+            body_lines = _body_lines(content.splitlines())
+    else:
+        body_lines = _body_lines(content.splitlines())
 
     if not body_lines:
         return "(no body content)"
@@ -101,10 +236,13 @@ def decide_destination(content: str) -> tuple[str, int, str]:
     Evaluate content against the triage rules.
     Returns (destination_dir, rule_number, status_label).
     """
+    # One lowered copy is kept on purpose: lower() costs about 0.5 ms per MB,
+    # while scanning with re.IGNORECASE instead costs tens of ms per MB and
+    # rules out the plain substring gates below.
     body_lower = content.lower()
 
     # Rule 1: "DONE" or "COMPLETED" anywhere (case-insensitive)
-    if re.search(r"\bdone\b", body_lower) or re.search(r"\bcompleted\b", body_lower):
+    if ("done" in body_lower or "completed" in body_lower) and _DONE_RE.search(body_lower):
         return DONE_DIR, 1, "Done"
 
     # Rule 2: Any line contains a question mark
@@ -112,16 +250,15 @@ def decide_destination(content: str) -> tuple[str, int, str]:
         return NEEDS_ACTION_DIR, 2, "Needs Action"
 
     # Rule 3: Body contains action verbs
-    for verb in ACTION_VERBS:
-        if re.search(r"\b" + verb + r"\b", body_lower):
-            return NEEDS_ACTION_DIR, 3, "Needs Action"
+    if any(verb in body_lower for verb in ACTION_VERBS) and _VERBS_RE.search(body_lower):
+        return NEEDS_ACTION_DIR, 3, "Needs Action"
 
     # Rule 4: Checklist with at least one unchecked item
-    if re.search(r"- \[ \]", content):
+    if "- [ ]" in content:
         return NEEDS_ACTION_DIR, 4, "Needs Action"
 
-    # Rule 5: Checklist where every item is checked
-    if re.search(r"- \[x\]", content, re.IGNORECASE) and not re.search(r"- \[ \]", content):
+    # Rule 5: Checklist where every item is checked (rule 4 ruled out unchecked ones)
+    if "- [x]" in content or "- [X]" in content:
         return DONE_DIR, 5, "Done"
 
     # Rule 6: Default — route to Needs_Action
@@ -129,21 +266,201 @@ def decide_destination(content: str) -> tuple[str, int, str]:
 
 
 # ---------------------------------------------------------------------------
-# Helper — find a non-conflicting output path (Step 5 edge case)
+# Helper — read a note's bytes with a single read call where possible
+# ---------------------------------------------------------------------------
+def _read_note(path: str) -> tuple[bytes, os.stat_result]:
+    """Return the raw bytes of *path* and its stat, without a buffered file object."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        st = os.fstat(fd)
+        # Asking for one byte more than the size tells a complete read
+        # apart from a file that is still growing
+        raw = os.read(fd, st.st_size + 1)
+        if len(raw) != st.st_size:
+            parts = [raw]
+            while chunk := os.read(fd, 64 * 1024):
+                parts.append(chunk)
+            raw = b"".join(parts)
+    finally:
+        os.close(fd)
+    return raw, st
+
+
+# ---------------------------------------------------------------------------
+# Helper — write the output file in one syscall where possible
+# ---------------------------------------------------------------------------
+def _write_output(fd: int, header: str, body: bytes, footer: str,
+                  source: tuple[str, os.stat_result] | None = None) -> None:
+    """
+    Write header, the already-encoded original note and footer to *fd*.
+
+    With *source* (the note's path and its stat from when it was read) the
+    body is copied straight from the inbox file with os.copy_file_range,
+    provided the file is unchanged since; otherwise *body* is written.
+    """
+    if os.linesep != "\n":
+        header = header.replace("\n", os.linesep)
+        footer = footer.replace("\n", os.linesep)
+    head, tail = header.encode("utf-8"), footer.encode("utf-8")
+
+    if source is not None and hasattr(os, "copy_file_range"):
+        _write_all(fd, head)
+        _copy_body(fd, body, *source)
+        _write_all(fd, tail)
+        return
+
+    chunks = [head, body, tail]
+    written = 0
+    if hasattr(os, "writev"):
+        written = os.writev(fd, chunks)
+        if written == sum(map(len, chunks)):
+            return
+    # No writev, or a partial write of a large note: finish with os.write
+    _write_all(fd, memoryview(b"".join(chunks))[written:])
+
+
+def _write_all(fd: int, data: bytes | memoryview) -> None:
+    remaining = memoryview(data)
+    while remaining:
+        remaining = remaining[os.write(fd, remaining):]
+
+
+def _copy_body(fd: int, body: bytes, path: str, st: os.stat_result) -> None:
+    """Copy *body* from *path* in-kernel, falling back to writing it from memory."""
+    copied = 0
+    try:
+        src = os.open(path, os.O_RDONLY)
+    except OSError:
+        src = None
+    if src is not None:
+        try:
+            now = os.fstat(src)
+            # Only copy the very bytes that were triaged
+            if (now.st_ino, now.st_size, now.st_mtime_ns) == (st.st_ino, st.st_size, st.st_mtime_ns):
+                while copied < len(body):
+                    n = os.copy_file_range(src, fd, len(body) - copied, copied)
+                    if n == 0:
+                        break
+                    copied += n
+        except OSError:
+            # EXDEV / EINVAL / ENOSYS on some kernels and filesystems; the
+            # output offset has only moved by what was actually copied
+            pass
+        finally:
+            os.close(src)
+    if copied < len(body):
+        _write_all(fd, memoryview(body)[copied:])
+
+
+# ---------------------------------------------------------------------------
+# Helper — "Received" timestamp, formatted at most once per second
+# ---------------------------------------------------------------------------
+_last_ts: tuple[int, str] = (0, "")  # (epoch second, formatted); swapped whole
+
+
+def _now_ts() -> str:
+    global _last_ts
+    now = int(time.time())
+    second, text = _last_ts
+    if second != now:
+        text = datetime.fromtimestamp(now).strftime("%Y-%m-%d %H:%M:%S")
+        _last_ts = (now, text)
+    return text
+
+
+# ---------------------------------------------------------------------------
+# Triage memo — identical notes (re-uploads, copies under a new name) reuse
+# the summary and routing decision instead of re-running the regexes
+# ---------------------------------------------------------------------------
+TRIAGE_CACHE_SIZE = 4096
+
+_triage_cache: OrderedDict[bytes, tuple[str, str, int, str]] = OrderedDict()
+_triage_lock = threading.Lock()
+
+
+def _triage(content: str, encoded: bytes) -> tuple[str, str, int, str]:
+    """Return (summary, destination_dir, rule_number, status_label) for *content*.
+
+    *encoded* is *content* as UTF-8, which the caller already has.
+    """
+    key = hashlib.blake2b(encoded, digest_size=16).digest()
+    with _triage_lock:
+        cached = _triage_cache.get(key)
+        if cached is not None:
+            _triage_cache.move_to_end(key)
+            return cached
+
+    result = (summarize(content), *decide_destination(content))
+    with _triage_lock:
+        _triage_cache[key] = result
+        if len(_triage_cache) > TRIAGE_CACHE_SIZE:
+            _triage_cache.popitem(last=False)
+    return result
+
+
+# ---------------------------------------------------------------------------
+# Processed-file manifest — skips unchanged notes across restarts
 # ---------------------------------------------------------------------------
-def unique_output_path(dest_dir: str, filename: str) -> str:
-    """If the filename already exists in dest_dir, append _2, _3, etc."""
-    candidate = os.path.join(dest_dir, filename)
-    if not os.path.exists(candidate):
-        return candidate
+class ProcessedManifest:
+    """sqlite record of processed inbox files, shared by the worker threads."""
+
+    def __init__(self, db_path: str = MANIFEST_PATH) -> None:
+        self.db_path = db_path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+            # Autocommit: each row is its own (cheap, WAL) transaction, so no
+            # write lock is held between files.  The recovery manager calls
+            # process_file from another process that never closes this.
+            conn = sqlite3.connect(
+                self.db_path,
+                timeout=MANIFEST_TIMEOUT,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS processed ("
+                "path TEXT PRIMARY KEY, mtime REAL, size INTEGER)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def is_processed(self, path: str, st: os.stat_result) -> bool:
+        """True if *path* was processed when it had this mtime and size."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT mtime, size FROM processed WHERE path = ?", (path,)
+                ).fetchone()
+        except sqlite3.Error as e:
+            # A broken manifest only costs a re-triage, never a lost note
+            error_logger.log_error("watcher.manifest", e, {"path": path, "phase": "lookup"})
+            return False
+        return row is not None and row[0] == st.st_mtime and row[1] == st.st_size
+
+    def mark(self, path: str, st: os.stat_result) -> None:
+        """Record *path* as processed."""
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO processed (path, mtime, size) VALUES (?, ?, ?)",
+                    (path, st.st_mtime, st.st_size),
+                )
+        except sqlite3.Error as e:
+            error_logger.log_error("watcher.manifest", e, {"path": path, "phase": "record"})
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
 
-    name, ext = os.path.splitext(filename)
-    counter = 2
-    while True:
-        candidate = os.path.join(dest_dir, f"{name}_{counter}{ext}")
-        if not os.path.exists(candidate):
-            return candidate
-        counter += 1
+
+manifest = ProcessedManifest()
 
 
 # ---------------------------------------------------------------------------
@@ -156,8 +473,12 @@ def process_file(filepath: str) -> None:
 
     # --- Step 5: encoding error handling ---
     try:
-        with open(filepath, "r", encoding="utf-8") as f:
-            content = f.read()
+        pre_st = os.stat(filepath)
+        if manifest.is_processed(filepath, pre_st):
+            print(f"[SKIP]  Already processed: {filename} is unchanged since it was triaged")
+            return
+        raw, st = _read_note(filepath)
+        content = raw.decode("utf-8")
     except (OSError, UnicodeDecodeError) as e:
         error_logger.log_error("watcher.process_file", e, {
             "filepath": filepath,
@@ -165,54 +486,76 @@ def process_file(filepath: str) -> None:
         })
         raise  # Let retry handle it
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # Same newline handling as reading in text mode.  Without a "\r" the
+    # file's bytes already are the encoded content.
+    encoded = raw
+    if "\r" in content:
+        content = content.replace("\r\n", "\n").replace("\r", "\n")
+        encoded = content.encode("utf-8")
+
+    timestamp = _now_ts()
 
     # --- Step 5: empty / whitespace-only file ---
     if not content.strip():
         dest_dir = NEEDS_ACTION_DIR
         rule_num = 0
-        status = "Needs Action"
-        title = os.path.splitext(filename)[0].replace("_", " ").replace("-", " ")
+        title = _title_from_filename(filename)
         summary = "(empty file — manual review required)"
     else:
         title = extract_title(content, filename)
-        summary = summarize(content)
-        dest_dir, rule_num, status = decide_destination(content)
+        # The status label is part of the rule's prebuilt template
+        summary, dest_dir, rule_num, _ = _triage(content, encoded)
+
+    dest_folder_name = DONE_NAME if dest_dir == DONE_DIR else NEEDS_ACTION_NAME
 
     # --- Step 5: idempotency — skip if already processed ---
-    output_path = unique_output_path(dest_dir, filename)
-    base_check = os.path.join(dest_dir, filename)
-    if os.path.exists(base_check):
-        print(f"[SKIP]  Already processed: {filename} exists in {os.path.basename(dest_dir)}/")
+    # O_EXCL creates the output atomically, so checking and claiming the
+    # name is one syscall and two workers can't both write it.
+    output_path = dest_dir + os.sep + filename
+    try:
+        fd = os.open(output_path, _CREATE_FLAGS, 0o644)
+    except FileExistsError:
+        print(f"[SKIP]  Already processed: {filename} exists in {dest_folder_name}/")
+        manifest.mark(filepath, pre_st)
         return
+    except OSError as e:
+        error_logger.log_error("watcher.process_file", e, {
+            "filepath": filepath,
+            "output_path": output_path,
+            "phase": "write",
+        })
+        raise
 
     # --- Step 4: write the output file using the SKILL.md template ---
-    dest_folder_name = os.path.basename(dest_dir)
-    rule_label = f"#{rule_num}" if rule_num > 0 else "#0 (empty file)"
-
-    response = f"""# {title}
-
-## Metadata
-- **Source:** Inbox/{filename}
-- **Received:** {timestamp}
-- **Routed to:** {dest_folder_name}/
-- **Triage rule:** {rule_label}
-- **Status:** {status}
-
-## Summary
-{summary}
-
-## Original Task
-{content}
+    header_template, footer = _RULE_TEMPLATES[rule_num]
+    header = header_template.format_map({
+        "title": title,
+        "filename": filename,
+        "timestamp": timestamp,
+        "summary": summary,
+    })
 
-## Agent Notes
-- Triage complete. File routed by rule {rule_label}.
-"""
+    # The encoded note is the "Original Task" block unless the platform
+    # line ending differs.  If it is the file's own bytes, large notes are
+    # copied straight from the file.
+    if os.linesep == "\n":
+        body = encoded
+        source = (filepath, st) if encoded is raw and len(raw) >= COPY_RANGE_MIN_BYTES else None
+    else:
+        body = content.replace("\n", os.linesep).encode("utf-8")
+        source = None
 
     try:
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(response)
+        try:
+            _write_output(fd, header, body, footer, source)
+        finally:
+            os.close(fd)
     except OSError as e:
+        # Don't leave a partial file behind: it would look already processed
+        try:
+            os.unlink(output_path)
+        except OSError:
+            pass
         error_logger.log_error("watcher.process_file", e, {
             "filepath": filepath,
             "output_path": output_path,
@@ -220,43 +563,109 @@ def process_file(filepath: str) -> None:
         })
         raise
 
+    manifest.mark(filepath, pre_st)
     error_logger.log_audit("watcher.triage", "success", {
         "file": filename,
         "destination": dest_folder_name,
         "rule": rule_num,
     })
-    print(f"[{timestamp}]  Processed: Inbox/{filename}  -->  {dest_folder_name}/{os.path.basename(output_path)}")
+    print(f"[{timestamp}]  Processed: Inbox/{filename}  -->  {dest_folder_name}/{filename}")
+
+
+# ---------------------------------------------------------------------------
+# Safe processing — log and queue failures for the recovery manager
+# ---------------------------------------------------------------------------
+def _safe_process(
+    fpath: str,
+    source: str = "watcher.startup",
+    phase: str = "initial_scan",
+) -> None:
+    """Process one file; failures are logged and queued for retry."""
+    try:
+        process_file(fpath)
+    except Exception as e:
+        error_logger.log_error(source, e, {
+            "filepath": fpath,
+            "phase": phase,
+        })
+        failed_queue.push(
+            source="watcher.process_file",
+            context={"filepath": fpath},
+            error=str(e),
+        )
+        print(f"[ERROR] Failed to process {fpath}: {e} (queued for retry)")
 
 
 # ---------------------------------------------------------------------------
 # Watchdog event handler
 # ---------------------------------------------------------------------------
-class InboxHandler(FileSystemEventHandler):
-    """React to new .md files appearing in the Inbox folder."""
+class InboxHandler:
+    """React to new .md files appearing in the Inbox folder.
+
+    Events are only queued on the observer thread.  A drain thread holds
+    each path until it has been quiet for SETTLE_SECONDS (repeat events
+    for the same path restart its wait), then hands it to a thread pool.
+
+    watchdog is imported lazily (see ``watchdog_handler``) so helpers such
+    as ``process_file`` can be imported without it.
+    """
+
+    def __init__(self) -> None:
+        self._events: queue.Queue = queue.Queue()
+        self._pool = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        self._drainer = threading.Thread(target=self._drain, name="inbox-drain", daemon=True)
+        self._drainer.start()
 
     def on_created(self, event):
-        if event.is_directory:
-            return
-        if not event.src_path.endswith(".md"):
-            return
+        self._events.put(event.src_path)
 
-        # Small delay so the OS finishes writing the file
-        time.sleep(0.5)
+    def watchdog_handler(self):
+        """Build the watchdog event handler that feeds this one."""
+        from watchdog.events import PatternMatchingEventHandler
 
-        try:
-            process_file(event.src_path)
-        except Exception as e:
-            error_logger.log_error("watcher.on_created", e, {
-                "filepath": event.src_path,
-                "phase": "handler",
-            })
-            # Queue for recovery
-            failed_queue.push(
-                source="watcher.process_file",
-                context={"filepath": event.src_path},
-                error=str(e),
-            )
-            print(f"[ERROR] Failed to process {event.src_path}: {e} (queued for retry)")
+        inbox = self
+
+        class _MarkdownCreatedHandler(PatternMatchingEventHandler):
+            def on_created(self, event):
+                inbox.on_created(event)
+
+        # Same filter as the startup scan: files ending in ".md"
+        return _MarkdownCreatedHandler(
+            patterns=["*.md"], ignore_directories=True, case_sensitive=True,
+        )
+
+    def stop(self) -> None:
+        """Process anything still pending, then stop the drain thread and pool."""
+        self._events.put(None)
+        self._drainer.join()
+        self._pool.shutdown(wait=True)
+
+    def _drain(self) -> None:
+        pending: dict[str, float] = {}  # path -> time it becomes ready
+        while True:
+            timeout = None
+            if pending:
+                timeout = max(0.0, min(pending.values()) - time.monotonic())
+            try:
+                path = self._events.get(timeout=timeout)
+            except queue.Empty:
+                path = ""
+
+            if path is None:  # shutting down
+                ready = sorted(pending)
+                pending.clear()
+            else:
+                now = time.monotonic()
+                if path:
+                    pending[path] = now + SETTLE_SECONDS
+                ready = sorted(p for p, t in pending.items() if t <= now)
+                for p in ready:
+                    del pending[p]
+
+            for p in ready:
+                self._pool.submit(_safe_process, p, "watcher.on_created", "handler")
+            if path is None:
+                return
 
 
 # ---------------------------------------------------------------------------
@@ -267,33 +676,28 @@ def main():
         os.makedirs(folder, exist_ok=True)
 
     # Process any .md files already sitting in the Inbox
-    existing = sorted(f for f in os.listdir(INBOX_DIR) if f.endswith(".md"))
+    existing = sorted(
+        entry.path for entry in os.scandir(INBOX_DIR)
+        if entry.name.endswith(".md") and entry.is_file()
+    )
     if existing:
         print(f"Found {len(existing)} existing file(s) in Inbox — processing now.")
-        for fname in existing:
-            fpath = os.path.join(INBOX_DIR, fname)
-            try:
-                process_file(fpath)
-            except Exception as e:
-                error_logger.log_error("watcher.startup", e, {
-                    "filepath": fpath,
-                    "phase": "initial_scan",
-                })
-                failed_queue.push(
-                    source="watcher.process_file",
-                    context={"filepath": fpath},
-                    error=str(e),
-                )
-                print(f"[ERROR] {fname}: {e} (queued for retry)")
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            list(pool.map(_safe_process, existing))
 
     # Start watching for new files
     handler = InboxHandler()
+    if WATCHER_BACKEND == "polling":
+        from watchdog.observers.polling import PollingObserver as Observer
+    else:
+        from watchdog.observers import Observer
     observer = Observer()
-    observer.schedule(handler, path=INBOX_DIR, recursive=False)
+    observer.schedule(handler.watchdog_handler(), path=INBOX_DIR, recursive=False)
     observer.start()
 
     error_logger.log_audit("watcher.started", "running", {
         "watching": INBOX_DIR,
+        "backend": WATCHER_BACKEND,
     })
 
     print()
@@ -314,6 +718,8 @@ def main():
         error_logger.log_audit("watcher.stopped", "shutdown", {})
 
     observer.join()
+    handler.stop()
+    manifest.close()
     print("Watcher stopped.")
 
 